@@ -5,6 +5,7 @@ import textwrap
 from app.config import HARD_MAX_SUBQUESTIONS, MAX_QUERIES_PER_SUBQUESTION, MAX_SUBQUESTIONS
 from app.models import Plan, SubQuestion
 from app.services.llm import call_openai_typed
+from app.text import collapsed_prefix
 
 
 PLANNER_SYSTEM = (
@@ -13,70 +14,85 @@ PLANNER_SYSTEM = (
 )
 
 
+# Static instructions lead the user prompt so identical prefixes hit provider prompt caching;
+# per-request inputs are appended after them.
+_PLANNER_STATIC_PREFIX = textwrap.dedent(
+    """
+    Requirements:
+    - Output keys: sub_questions, assumptions.
+    - sub_questions: 3 to 6 items (target 4).
+    - Each sub_question has: id, question, priority, search_queries.
+    - id format: sq1, sq2, ...
+    - priority is unique integer (1 = highest).
+    - search_queries: 2 to 4 short focused web queries.
+    - If user query is ambiguous, add explicit assumptions.
+    - If the query can be answered directly from recent thread history/context
+      (without web lookup), include assumption EXACTLY: SKIP_WEB_RESEARCH
+    """
+).strip()
+
+
+_PLANNER_TEMPLATE = (
+    _PLANNER_STATIC_PREFIX
+    + "\n\nUser query:\n{query}"
+    + "\n\nRecent thread history:\n{history}"
+    + "\n\nShared memory summary:\n{memory}"
+)
+
+
 def planner_prompt(query: str, history: list[dict[str, str]], shared_memory: dict | None = None) -> str:
     recent_history = _summarize_history(history)
     memory_summary = _summarize_shared_memory(shared_memory or {})
-    return textwrap.dedent(
-        f"""
-        User query:
-        {query}
-
-        Recent thread history:
-        {recent_history or "- (none)"}
-
-        Shared memory summary:
-        {memory_summary or "- (none)"}
-
-        Requirements:
-        - Output keys: sub_questions, assumptions.
-        - sub_questions: 3 to 6 items (target 4).
-        - Each sub_question has: id, question, priority, search_queries.
-        - id format: sq1, sq2, ...
-        - priority is unique integer (1 = highest).
-        - search_queries: 2 to 4 short focused web queries.
-        - If user query is ambiguous, add explicit assumptions.
-        - If the query can be answered directly from recent thread history/context
-          (without web lookup), include assumption EXACTLY: SKIP_WEB_RESEARCH
-        """
-    ).strip()
+    return _PLANNER_TEMPLATE.format_map(
+        {
+            "query": query,
+            "history": recent_history or "- (none)",
+            "memory": memory_summary or "- (none)",
+        }
+    )
 
 
 def _summarize_history(history: list[dict[str, str]]) -> str:
     if not history:
         return ""
-    selected: list[str] = []
     # Keep at most two latest user messages and one assistant message to avoid token bloat.
+    # Walk newest-first but fill slots from the back so the output is already chronological.
+    selected: list[str | None] = [None, None, None]
+    slot = len(selected)
     user_count = 0
     assistant_count = 0
     for item in reversed(history):
         role = item.get("role", "user")
-        content = " ".join((item.get("content") or "").split())
+        content = collapsed_prefix(item.get("content") or "", 220)
         if not content:
             continue
         if role == "user" and user_count < 2:
             user_count += 1
-            selected.append(f"- user: {content[:220]}")
+            slot -= 1
+            selected[slot] = f"- user: {content}"
         elif role == "assistant" and assistant_count < 1:
             assistant_count += 1
-            selected.append(f"- assistant: {content[:220]}")
+            slot -= 1
+            selected[slot] = f"- assistant: {content}"
         if user_count >= 2 and assistant_count >= 1:
             break
-    return "\n".join(reversed(selected))
+    return "\n".join(selected[slot:])
 
 
 def _summarize_shared_memory(shared_memory: dict) -> str:
     if not shared_memory:
         return ""
     lines: list[str] = []
-    recent_reports = shared_memory.get("recent_reports", []) or []
+    recent_reports = shared_memory.get("recent_reports") or ()
     for idx, item in enumerate(recent_reports[-2:], start=1):
-        q = str(item.get("query", "")).strip()
-        s = str(item.get("executive_summary", "")).strip()
+        # Bound strip work to a prefix; stored summaries can be long.
+        q = str(item.get("query") or "")[:320].strip()[:160]
+        s = str(item.get("executive_summary") or "")[:440].strip()[:220]
         if q:
-            lines.append(f"- memory.report{idx}.query: {q[:160]}")
+            lines.append(f"- memory.report{idx}.query: {q}")
         if s:
-            lines.append(f"- memory.report{idx}.summary: {s[:220]}")
-    unresolved = shared_memory.get("open_gaps", []) or []
+            lines.append(f"- memory.report{idx}.summary: {s}")
+    unresolved = shared_memory.get("open_gaps") or ()
     for gap in unresolved[:3]:
         lines.append(f"- memory.gap: {str(gap)[:180]}")
     return "\n".join(lines)
@@ -107,11 +123,18 @@ def _fallback_plan(query: str) -> Plan:
 
 
 def _ensure_two_queries(queries: list[str], question: str) -> list[str]:
-    deduped = [q.strip() for q in queries if q and q.strip()]
+    deduped: list[str] = []
+    for q in queries:
+        stripped = q.strip() if q else ""
+        if stripped:
+            deduped.append(stripped)
+            if len(deduped) == MAX_QUERIES_PER_SUBQUESTION:
+                return deduped
     if not deduped:
-        deduped = [question]
-    while len(deduped) < MAX_QUERIES_PER_SUBQUESTION:
-        deduped.append(f"{question} latest evidence")
+        deduped.append(question)
+    missing = MAX_QUERIES_PER_SUBQUESTION - len(deduped)
+    if missing > 0:
+        deduped.extend([f"{question} latest evidence"] * missing)
     return deduped[:MAX_QUERIES_PER_SUBQUESTION]
 
 
@@ -121,14 +144,15 @@ async def run_planner(
     prior_context: str = "",
     shared_memory: dict | None = None,
 ) -> Plan:
-    history_with_context = list(history)
+    history_with_context = history
     if prior_context:
-        history_with_context.append(
+        history_with_context = [
+            *history,
             {
                 "role": "assistant",
                 "content": f"Prior context summary: {prior_context[:280]}",
-            }
-        )
+            },
+        ]
     prompt = planner_prompt(query=query, history=history_with_context, shared_memory=shared_memory)
     try:
         plan = await call_openai_typed(
@@ -138,27 +162,19 @@ async def run_planner(
         )
         # Normalize id/priority ordering for safety.
         sorted_subqs = sorted(plan.sub_questions, key=lambda sq: sq.priority)
+        if len(sorted_subqs) < 3:
+            return _fallback_plan(query)
+        # Truncate first, then normalize once. Fields come from the validated LLM plan and
+        # _ensure_two_queries, so skip re-running validators.
         normalized = [
-            SubQuestion(
+            SubQuestion.model_construct(
                 id=f"sq{idx + 1}",
                 question=sq.question,
                 priority=idx + 1,
                 search_queries=_ensure_two_queries(sq.search_queries, sq.question),
             )
-            for idx, sq in enumerate(sorted_subqs[:HARD_MAX_SUBQUESTIONS])
-        ]
-        if len(normalized) < 3:
-            return _fallback_plan(query)
-        normalized = normalized[:MAX_SUBQUESTIONS]
-        normalized = [
-            SubQuestion(
-                id=item.id,
-                question=item.question,
-                priority=item.priority,
-                search_queries=_ensure_two_queries(item.search_queries, item.question),
-            )
-            for item in normalized
+            for idx, sq in enumerate(sorted_subqs[: min(HARD_MAX_SUBQUESTIONS, MAX_SUBQUESTIONS)])
         ]
-        return Plan(sub_questions=normalized, assumptions=plan.assumptions)
+        return Plan.model_construct(sub_questions=normalized, assumptions=plan.assumptions)
     except Exception:
         return _fallback_plan(query)
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import re
 import textwrap
+from itertools import chain
+from typing import Iterable
 
 from pydantic import BaseModel, Field
 
@@ -23,6 +25,43 @@ SECTION_HEADERS = (
 
 CITATION_ANCHOR_RE = re.compile(r"\[S\d+\]")
 
+LIMITATION_MARKERS = frozenset(("limitations", "assumption"))
+BALANCE_MARKERS = frozenset(("risk", "opportunit", "trade-off", "counter"))
+_PROSE_MARKERS = LIMITATION_MARKERS | BALANCE_MARKERS
+
+PASS_SCORE = 72
+# A short body with missing sections scores 57, which can never pass; skip the remaining
+# checks and the LLM round-trip below this score.
+HARD_FAIL_SCORE = 60
+
+# One pass over the report: section headers are case-sensitive, prose markers are not.
+_REPORT_SCAN_RE = re.compile(
+    "(?P<header>" + "|".join(re.escape(header) for header in SECTION_HEADERS) + ")"
+    + f"|(?P<anchor>{CITATION_ANCHOR_RE.pattern})"
+    + "|(?i:(?P<marker>" + "|".join(re.escape(m) for m in sorted(_PROSE_MARKERS)) + "))"
+)
+# Header matches consume their text, so credit the markers they contain.
+_HEADER_MARKERS = {
+    header: frozenset(marker for marker in _PROSE_MARKERS if marker in header.lower())
+    for header in SECTION_HEADERS
+}
+
+# Static instructions lead the user prompt so the prefix stays cacheable across checks.
+_QUALITY_STATIC_PREFIX = textwrap.dedent(
+    """
+    Return JSON:
+    - pass_check: boolean
+    - feedback: concise list of issues to fix (max 5)
+    """
+).strip()
+
+_QUALITY_TEMPLATE = (
+    _QUALITY_STATIC_PREFIX
+    + "\n\nQuery:\n{query}"
+    + "\n\nExecutive Summary:\n{executive_summary}"
+    + "\n\nReport:\n{report}"
+)
+
 
 class _LLMQualityOutput(BaseModel):
     pass_check: bool
@@ -42,28 +81,47 @@ def _deterministic_quality(
         issues.append("Report body is too short; add more concrete findings.")
         score -= 18
 
-    missing_sections = [header for header in SECTION_HEADERS if header not in report]
+    found_headers: set[str] = set()
+    found_markers: set[str] = set()
+    anchor_count = 0
+    for match in _REPORT_SCAN_RE.finditer(report):
+        kind = match.lastgroup
+        if kind == "anchor":
+            anchor_count += 1
+        elif kind == "header":
+            header = match.group(kind)
+            found_headers.add(header)
+            found_markers |= _HEADER_MARKERS[header]
+        else:
+            found_markers.add(match.group(kind).lower())
+
+    missing_sections = [header for header in SECTION_HEADERS if header not in found_headers]
     if missing_sections:
         issues.append("Missing required sections: " + ", ".join(missing_sections) + ".")
         score -= 25
 
-    summary_lines = [line for line in executive_summary.splitlines() if line.strip()]
-    if len(summary_lines) < 4:
+    if score < HARD_FAIL_SCORE:
+        return max(0, score), issues
+
+    summary_lines = 0
+    for line in executive_summary.splitlines():
+        if line.strip():
+            summary_lines += 1
+            if summary_lines >= 4:
+                break
+    if summary_lines < 4:
         issues.append("Executive summary is too thin; target 5-8 concise lines.")
         score -= 12
 
-    text_lower = report.lower()
-    if "limitations" not in text_lower and "assumption" not in text_lower:
+    if LIMITATION_MARKERS.isdisjoint(found_markers):
         issues.append("Limitations/assumptions are not explicit.")
         score -= 15
 
-    anchor_count = len(CITATION_ANCHOR_RE.findall(report))
     if anchor_count < 3 and len(citations) < 4:
         issues.append("Citation grounding is weak; include inline anchors like [S1].")
         score -= 18
 
-    balance_markers = ("risk", "opportunit", "trade-off", "counter")
-    balance_hits = sum(1 for marker in balance_markers if marker in text_lower)
+    balance_hits = len(BALANCE_MARKERS & found_markers)
     if balance_hits < 2:
         issues.append("Analysis appears one-sided; include balanced perspective.")
         score -= 12
@@ -71,6 +129,19 @@ def _deterministic_quality(
     return max(0, min(100, score)), issues
 
 
+def _dedupe_capped(items: Iterable[str], cap: int) -> list[str]:
+    seen: set[str] = set()
+    out: list[str] = []
+    for item in items:
+        if item in seen:
+            continue
+        seen.add(item)
+        out.append(item)
+        if len(out) >= cap:
+            break
+    return out
+
+
 def _default_rewrite_guidance() -> list[str]:
     return [
         "Improve balance: cover both upside and downside explicitly.",
@@ -91,25 +162,23 @@ async def run_quality_check(
         executive_summary=executive_summary,
         citations=citations,
     )
+    if base_score < HARD_FAIL_SCORE:
+        return QualityCheck(
+            passed=False,
+            score=base_score,
+            issues=deterministic_issues,
+            refinement_queries=(deterministic_issues[:4] or _default_rewrite_guidance()),
+        )
 
+    prompt = _QUALITY_TEMPLATE.format_map(
+        {
+            "query": query,
+            "executive_summary": executive_summary,
+            "report": report[:7000],
+        }
+    )
     llm_pass = True
     llm_feedback: list[str] = []
-    prompt = textwrap.dedent(
-        f"""
-        Query:
-        {query}
-
-        Executive Summary:
-        {executive_summary}
-
-        Report:
-        {report[:7000]}
-
-        Return JSON:
-        - pass_check: boolean
-        - feedback: concise list of issues to fix (max 5)
-        """
-    ).strip()
     try:
         llm_out = await call_openai_typed(
             system_prompt=QUALITY_SYSTEM,
@@ -122,14 +191,14 @@ async def run_quality_check(
         llm_pass = True
         llm_feedback = []
 
-    combined_issues = list(dict.fromkeys(deterministic_issues + llm_feedback))[:8]
-    passed = (base_score >= 72) and llm_pass and (len(deterministic_issues) <= 1)
+    combined_issues = _dedupe_capped(chain(deterministic_issues, llm_feedback), 8)
+    passed = (base_score >= PASS_SCORE) and llm_pass and (len(deterministic_issues) <= 1)
     if passed:
-        return QualityCheck(passed=True, score=max(72, base_score), issues=[], refinement_queries=[])
+        return QualityCheck(passed=True, score=max(PASS_SCORE, base_score), issues=[], refinement_queries=[])
 
     return QualityCheck(
         passed=False,
-        score=min(base_score, 71),
+        score=min(base_score, PASS_SCORE - 1),
         issues=combined_issues,
         refinement_queries=(combined_issues[:4] or _default_rewrite_guidance()),
     )
@@ -3,8 +3,10 @@ from __future__ import annotations
 import asyncio
 import re
 import textwrap
-from collections import OrderedDict, defaultdict
+from collections import Counter
 from datetime import datetime, timezone
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
 from typing import Awaitable, Callable
 
 from app.config import (
@@ -30,33 +32,57 @@ from app.tools.web_search_router import search_web_parallel
 
 EmitEvent = Callable[[str, dict], Awaitable[None]]
 
+# Search results requested per open accept slot; headroom for dedupe/threshold/domain rejections.
+CANDIDATES_PER_OPEN_SLOT = 3
+
 RESEARCH_SYSTEM = (
     "You are a research synthesis agent. Return ONLY JSON. "
     "Use the provided findings to produce concise evidence bullets, contradictions, and gaps."
 )
 
-WORD_RE = re.compile(r"\b[a-zA-Z0-9]{3,}\b")
+_SYNTHESIS_TEMPLATE = textwrap.dedent(
+    """
+    Sub-question:
+    {question}
+
+    Findings:
+    {findings}
+
+    Return keys:
+    - evidence_bullets (4-8)
+    - contradictions (0-4)
+    - gaps (1-5)
+    """
+).strip()
+
+WORD_RE = re.compile(r"\b[a-z0-9]{3,}\b", re.ASCII)
 YEAR_RE = re.compile(r"\b(20\d{2})\b")
 
 
+# Budget and run-control state is only touched from the event loop thread, and none of the
+# check-then-mutate methods below await, so they are atomic without an asyncio.Lock.
 class _BudgetManager:
     def __init__(self, existing_notes: dict[str, ResearchNote] | None = None) -> None:
-        self._lock = asyncio.Lock()
         self.accepted_urls: set[str] = set()
-        self.domain_counts: dict[str, int] = defaultdict(int)
+        self.domain_counts: Counter[str] = Counter()
         self.accepted_total = 0
-        self.accepted_per_subquestion: dict[str, int] = defaultdict(int)
+        self.accepted_per_subquestion: Counter[str] = Counter()
 
         if existing_notes:
+            accepted_domains: list[str] = []
             for sq_id, note in existing_notes.items():
+                accepted_in_note = 0
                 for finding in note.findings:
                     url_key = normalize_url(str(finding.url))
                     if url_key in self.accepted_urls:
                         continue
                     self.accepted_urls.add(url_key)
-                    self.accepted_total += 1
-                    self.accepted_per_subquestion[sq_id] += 1
-                    self.domain_counts[finding.source_name] += 1
+                    accepted_in_note += 1
+                    accepted_domains.append(finding.source_name)
+                if accepted_in_note:
+                    self.accepted_per_subquestion[sq_id] += accepted_in_note
+            self.accepted_total = len(self.accepted_urls)
+            self.domain_counts.update(accepted_domains)
 
     def global_exhausted(self) -> bool:
         return self.accepted_total >= MAX_ACCEPTED_SOURCES_TOTAL
@@ -64,69 +90,88 @@ class _BudgetManager:
     def subquestion_cap_reached(self, sub_question_id: str) -> bool:
         return self.accepted_per_subquestion[sub_question_id] >= MAX_ACCEPTED_PER_SUBQUESTION
 
-    async def try_accept(self, sub_question_id: str, finding: SourceFinding) -> tuple[bool, str]:
-        url_key = normalize_url(str(finding.url))
-        async with self._lock:
-            if url_key in self.accepted_urls:
-                return False, "deduped"
-            if self.accepted_total >= MAX_ACCEPTED_SOURCES_TOTAL:
-                return False, "global_cap"
-            if self.accepted_per_subquestion[sub_question_id] >= MAX_ACCEPTED_PER_SUBQUESTION:
-                return False, "subquestion_cap"
-            if self.domain_counts[finding.source_name] >= MAX_DOMAIN_REPEAT:
-                return False, "domain_cap"
-
-            self.accepted_urls.add(url_key)
-            self.accepted_total += 1
-            self.accepted_per_subquestion[sub_question_id] += 1
-            self.domain_counts[finding.source_name] += 1
-            return True, "accepted"
+    def remaining_slots(self, sub_question_id: str) -> int:
+        return max(
+            0,
+            min(
+                MAX_ACCEPTED_SOURCES_TOTAL - self.accepted_total,
+                MAX_ACCEPTED_PER_SUBQUESTION - self.accepted_per_subquestion[sub_question_id],
+            ),
+        )
+
+    def try_accept(
+        self,
+        sub_question_id: str,
+        finding: SourceFinding,
+        url_key: str | None = None,
+    ) -> tuple[bool, str]:
+        if url_key is None:
+            url_key = normalize_url(str(finding.url))
+        if url_key in self.accepted_urls:
+            return False, "deduped"
+        if self.accepted_total >= MAX_ACCEPTED_SOURCES_TOTAL:
+            return False, "global_cap"
+        if self.accepted_per_subquestion[sub_question_id] >= MAX_ACCEPTED_PER_SUBQUESTION:
+            return False, "subquestion_cap"
+        if self.domain_counts[finding.source_name] >= MAX_DOMAIN_REPEAT:
+            return False, "domain_cap"
+
+        self.accepted_urls.add(url_key)
+        self.accepted_total += 1
+        self.accepted_per_subquestion[sub_question_id] += 1
+        self.domain_counts[finding.source_name] += 1
+        return True, "accepted"
 
 
 class _RunControls:
     def __init__(self, max_calls: int) -> None:
-        self._lock = asyncio.Lock()
         self.max_calls = max(1, max_calls)
         self.calls_made = 0
         self.quota_exhausted = False
         self.quota_notified = False
         self.call_cap_notified = False
 
-    async def try_reserve_call(self) -> bool:
-        async with self._lock:
-            if self.quota_exhausted:
-                return False
-            if self.calls_made >= self.max_calls:
-                return False
-            self.calls_made += 1
+    def try_reserve_call(self) -> bool:
+        if self.quota_exhausted:
+            return False
+        if self.calls_made >= self.max_calls:
+            return False
+        self.calls_made += 1
+        return True
+
+    def mark_quota_exhausted(self) -> bool:
+        self.quota_exhausted = True
+        if not self.quota_notified:
+            self.quota_notified = True
             return True
+        return False
 
-    async def mark_quota_exhausted(self) -> bool:
-        async with self._lock:
-            self.quota_exhausted = True
-            if not self.quota_notified:
-                self.quota_notified = True
-                return True
-            return False
+    def is_quota_exhausted(self) -> bool:
+        return self.quota_exhausted
 
-    async def is_quota_exhausted(self) -> bool:
-        async with self._lock:
-            return self.quota_exhausted
+    def mark_call_cap_reached(self) -> bool:
+        if not self.call_cap_notified:
+            self.call_cap_notified = True
+            return True
+        return False
 
-    async def mark_call_cap_reached(self) -> bool:
-        async with self._lock:
-            if not self.call_cap_notified:
-                self.call_cap_notified = True
-                return True
-            return False
+
+def _source_fetch_payload(sub_question_id: str, finding: SourceFinding, status: str) -> dict:
+    return {
+        "sub_question_id": sub_question_id,
+        "source_name": finding.source_name,
+        "title": finding.title,
+        "url": str(finding.url),
+        "status": status,
+    }
 
 
 def _tokenize(text: str) -> set[str]:
-    return {token.lower() for token in WORD_RE.findall(text)}
+    # Lowercase once up front rather than per token.
+    return set(WORD_RE.findall(text.lower()))
 
 
-def _relevance_score(sub_question: SubQuestion, query: str, finding: SourceFinding) -> float:
-    target_tokens = _tokenize(f"{sub_question.question} {query}")
+def _relevance_score(target_tokens: set[str], finding: SourceFinding) -> float:
     if not target_tokens:
         return 0.5
     content_tokens = _tokenize(f"{finding.title} {finding.snippet}")
@@ -136,12 +181,17 @@ def _relevance_score(sub_question: SubQuestion, query: str, finding: SourceFindi
     return min(overlap / max(len(target_tokens), 1), 1.0)
 
 
-def _recency_proxy(finding: SourceFinding) -> float:
-    current_year = datetime.now(timezone.utc).year
-    matches = [int(year) for year in YEAR_RE.findall(f"{finding.title} {finding.snippet}")]
-    if not matches:
+def _recency_proxy(finding: SourceFinding, current_year: int) -> float:
+    min_delta: int | None = None
+    for match in YEAR_RE.finditer(f"{finding.title} {finding.snippet}"):
+        delta = abs(current_year - int(match.group(1)))
+        if min_delta is None or delta < min_delta:
+            min_delta = delta
+            if min_delta <= 1:
+                # Already in the top recency bucket; later years cannot improve it.
+                break
+    if min_delta is None:
         return 0.5
-    min_delta = min(abs(current_year - year) for year in matches)
     if min_delta <= 1:
         return 1.0
     if min_delta <= 3:
@@ -149,18 +199,19 @@ def _recency_proxy(finding: SourceFinding) -> float:
     return 0.45
 
 
-def _acceptance_score(sub_question: SubQuestion, query: str, finding: SourceFinding) -> float:
-    relevance = _relevance_score(sub_question, query, finding)
-    recency = _recency_proxy(finding)
+def _acceptance_score(target_tokens: set[str], finding: SourceFinding, current_year: int) -> float:
+    relevance = _relevance_score(target_tokens, finding)
+    recency = _recency_proxy(finding, current_year)
     return (0.80 * relevance) + (0.20 * recency)
 
 
 def _fallback_synthesis(findings: list[SourceFinding]) -> ResearchSynthesis:
-    bullets = [f.title for f in findings[:8]]
-    if len(bullets) < 4:
-        bullets += ["Insufficient evidence volume for this sub-question."] * (4 - len(bullets))
+    bullets = [f.title for f in islice(findings, 8)]
+    missing = 4 - len(bullets)
+    if missing > 0:
+        bullets.extend(["Insufficient evidence volume for this sub-question."] * missing)
     return ResearchSynthesis(
-        evidence_bullets=bullets[:8],
+        evidence_bullets=bullets,
         contradictions=[],
         gaps=["Need additional high-quality sources for stronger confidence."],
     )
@@ -168,22 +219,11 @@ def _fallback_synthesis(findings: list[SourceFinding]) -> ResearchSynthesis:
 
 async def _synthesize_research(sub_question: SubQuestion, findings: list[SourceFinding]) -> ResearchSynthesis:
     raw_findings = "\n".join(
-        f"- title: {f.title}\n  url: {f.url}\n  snippet: {f.snippet[:320]}" for f in findings[:12]
+        f"- title: {f.title}\n  url: {f.url}\n  snippet: {f.snippet[:320]}" for f in islice(findings, 12)
+    )
+    prompt = _SYNTHESIS_TEMPLATE.format_map(
+        {"question": sub_question.question, "findings": raw_findings or "- none"}
     )
-    prompt = textwrap.dedent(
-        f"""
-        Sub-question:
-        {sub_question.question}
-
-        Findings:
-        {raw_findings or "- none"}
-
-        Return keys:
-        - evidence_bullets (4-8)
-        - contradictions (0-4)
-        - gaps (1-5)
-        """
-    ).strip()
     try:
         synthesis = await call_openai_typed(
             system_prompt=RESEARCH_SYSTEM,
@@ -207,14 +247,25 @@ async def _collect_candidates(
     query: str,
     phase: str,
     intent: str,
+    remaining_slots: int,
 ) -> list[SourceFinding]:
+    # Request only what the open accept slots can use, with headroom for rejections.
+    candidate_cap = remaining_slots * CANDIDATES_PER_OPEN_SLOT
     if intent == "historical":
         return await search_web_parallel(
             query=query,
-            max_results=HISTORICAL_MAX_RESULTS_PER_QUERY,
+            max_results=min(HISTORICAL_MAX_RESULTS_PER_QUERY, candidate_cap),
             include_domains=HISTORICAL_DOMAIN_SEEDS if phase == "historical_hint" else None,
         )
-    return await search_web_parallel(query=query, max_results=MAX_RESULTS_PER_QUERY)
+    return await search_web_parallel(query=query, max_results=min(MAX_RESULTS_PER_QUERY, candidate_cap))
+
+
+async def _collect_fallback_candidates(*, query: str, intent: str, remaining_slots: int) -> list[SourceFinding]:
+    return await search_web_parallel(
+        query=query,
+        max_results=min(MAX_RESULTS_PER_QUERY, remaining_slots * CANDIDATES_PER_OPEN_SLOT),
+        include_domains=HISTORICAL_DOMAIN_SEEDS if intent == "historical" else None,
+    )
 
 
 async def research_sub_question(
@@ -223,11 +274,11 @@ async def research_sub_question(
     budget: _BudgetManager,
     controls: _RunControls,
     *,
-    simulated_failures: set[str],
+    simulated_failures: frozenset[str],
     intent: str,
 ) -> tuple[ResearchNote, list[Citation], list[dict]]:
     errors: list[dict] = []
-    collected: OrderedDict[str, SourceFinding] = OrderedDict()
+    collected: dict[str, SourceFinding] = {}
 
     await emit_event(
         "research_progress",
@@ -239,116 +290,101 @@ async def research_sub_question(
         },
     )
 
-    if sq.id in simulated_failures:
-        detail = f"Simulated Tavily failure for {sq.id}."
+    async def _record_error(detail: str) -> None:
         errors.append({"stage": "research", "sub_question_id": sq.id, "detail": detail})
         await emit_event("error", {"stage": "research", "sub_question_id": sq.id, "detail": detail})
 
+    if sq.id in simulated_failures:
+        await _record_error(f"Simulated Tavily failure for {sq.id}.")
+
+    current_year = datetime.now(timezone.utc).year
     if intent == "historical":
         phases = ["historical_hint", "broad"]
+        threshold = HISTORICAL_ACCEPTANCE_SCORE_THRESHOLD
     else:
         phases = ["broad"]
-
-    for query in sq.search_queries[:MAX_QUERIES_PER_SUBQUESTION]:
+        threshold = ACCEPTANCE_SCORE_THRESHOLD
+
+    # Searches run one step at a time: whether the next (query, phase) runs at all depends on
+    # what this one accepted, and a search started early would spend a call the caps would skip.
+    # Sub-questions still research concurrently in run_research_batch.
+    queries = [] if sq.id in simulated_failures else sq.search_queries[:MAX_QUERIES_PER_SUBQUESTION]
+    call_cap_hit = False
+    for query in queries:
         if budget.global_exhausted() or budget.subquestion_cap_reached(sq.id):
             break
-
+        # Same for every candidate of this query; tokenize once instead of per finding.
+        target_tokens = _tokenize(f"{sq.question} {query}")
         for phase in phases:
             if budget.global_exhausted() or budget.subquestion_cap_reached(sq.id):
                 break
-
-            if sq.id in simulated_failures:
-                continue
-
-            use_fallback = await controls.is_quota_exhausted()
-            findings: list[SourceFinding] = []
-            if not use_fallback:
-                if not await controls.try_reserve_call():
-                    should_emit_cap = await controls.mark_call_cap_reached()
-                    if should_emit_cap:
-                        await emit_event(
-                            "error",
-                            {
-                                "stage": "research",
-                                "sub_question_id": sq.id,
-                                "detail": (
-                                    f"Search call cap reached ({controls.calls_made}/{controls.max_calls}) "
-                                    "(SEARCH_MAX_CALLS_PER_RUN); "
-                                    "skipping remaining searches for this run."
-                                ),
-                            },
-                        )
-                    break
-
-            if not use_fallback:
-                try:
-                    findings = await _collect_candidates(sq=sq, query=query, phase=phase, intent=intent)
-                except SearchToolError as exc:
-                    detail = str(exc)
-                    quota_hit = "exceeds your plan's set usage limit" in detail.lower()
-                    if quota_hit and TAVILY_FAIL_FAST_ON_QUOTA:
-                        should_emit_quota = await controls.mark_quota_exhausted()
-                        quota_msg = "Tavily quota exceeded; continuing with Exa/Firecrawl only."
-                        if should_emit_quota:
-                            await emit_event(
-                                "error",
-                                {
-                                    "stage": "research",
-                                    "sub_question_id": sq.id,
-                                    "detail": quota_msg,
-                                },
-                            )
-                            errors.append(
-                                {"stage": "research", "sub_question_id": sq.id, "detail": quota_msg}
-                            )
-                        use_fallback = True
-                    else:
-                        errors.append({"stage": "research", "sub_question_id": sq.id, "detail": detail})
-                        await emit_event(
-                            "error",
-                            {
-                                "stage": "research",
-                                "sub_question_id": sq.id,
-                                "detail": detail,
-                            },
-                        )
-                        continue
-
-            if use_fallback:
-                try:
-                    findings = await search_web_parallel(
-                        query=query,
-                        max_results=MAX_RESULTS_PER_QUERY,
-                        include_domains=HISTORICAL_DOMAIN_SEEDS if intent == "historical" else None,
-                    )
-                except SearchToolError as exc:
-                    errors.append({"stage": "research", "sub_question_id": sq.id, "detail": str(exc)})
+            use_fallback = controls.is_quota_exhausted()
+            if not use_fallback and not controls.try_reserve_call():
+                call_cap_hit = True
+                if controls.mark_call_cap_reached():
                     await emit_event(
                         "error",
                         {
                             "stage": "research",
                             "sub_question_id": sq.id,
-                            "detail": str(exc),
+                            "detail": (
+                                f"Search call cap reached ({controls.calls_made}/{controls.max_calls}) "
+                                "(SEARCH_MAX_CALLS_PER_RUN); "
+                                "skipping remaining searches for this run."
+                            ),
                         },
                     )
+                break
+
+            remaining_slots = budget.remaining_slots(sq.id)
+            findings: list[SourceFinding] = []
+            try:
+                if use_fallback:
+                    findings = await _collect_fallback_candidates(
+                        query=query, intent=intent, remaining_slots=remaining_slots
+                    )
+                else:
+                    findings = await _collect_candidates(
+                        sq=sq, query=query, phase=phase, intent=intent, remaining_slots=remaining_slots
+                    )
+            except SearchToolError as exc:
+                detail = str(exc)
+                quota_hit = "exceeds your plan's set usage limit" in detail.lower()
+                if use_fallback or not (quota_hit and TAVILY_FAIL_FAST_ON_QUOTA):
+                    await _record_error(detail)
+                    continue
+                if controls.mark_quota_exhausted():
+                    await _record_error("Tavily quota exceeded; continuing with Exa/Firecrawl only.")
+                try:
+                    findings = await _collect_fallback_candidates(
+                        query=query, intent=intent, remaining_slots=remaining_slots
+                    )
+                except SearchToolError as fallback_exc:
+                    await _record_error(str(fallback_exc))
                     continue
 
+            # Rank every candidate: dedupe, domain-diversity and cap rejections can skip any
+            # number of top entries, so a top-N cut could drop acceptable lower-ranked ones.
             scored = sorted(
-                [(_acceptance_score(sq, query, finding), finding) for finding in findings],
-                key=lambda item: item[0],
+                (
+                    (
+                        _acceptance_score(target_tokens, finding, current_year),
+                        normalize_url(str(finding.url)),
+                        finding,
+                    )
+                    for finding in findings
+                ),
+                key=itemgetter(0),
                 reverse=True,
             )
 
-            accepted_in_phase = 0
+            # source_fetch events are flushed once per phase instead of awaited per candidate.
+            pending_events: list[dict] = []
             existing_domains = {item.source_name for item in collected.values()}
-            for score, finding in scored:
-                threshold = (
-                    HISTORICAL_ACCEPTANCE_SCORE_THRESHOLD
-                    if intent == "historical"
-                    else ACCEPTANCE_SCORE_THRESHOLD
-                )
+            for score, url_key, finding in scored:
                 if score < threshold:
-                    continue
+                    # Scores are sorted descending, so nothing further clears the bar.
+                    break
                 # First pass favors domain diversity when we still have low domain spread.
                 if (
                     len(existing_domains) < MIN_UNIQUE_DOMAINS_PER_SUBQUESTION
@@ -356,35 +392,15 @@ async def research_sub_question(
                 ):
                     continue
 
-                accepted, reason = await budget.try_accept(sq.id, finding)
+                accepted, reason = budget.try_accept(sq.id, finding, url_key)
                 if not accepted:
                     if reason == "deduped":
-                        await emit_event(
-                            "source_fetch",
-                            {
-                                "sub_question_id": sq.id,
-                                "source_name": finding.source_name,
-                                "title": finding.title,
-                                "url": str(finding.url),
-                                "status": "deduped",
-                            },
-                        )
+                        pending_events.append(_source_fetch_payload(sq.id, finding, "deduped"))
                     continue
 
-                url_key = normalize_url(str(finding.url))
                 collected[url_key] = finding
                 existing_domains.add(finding.source_name)
-                accepted_in_phase += 1
-                await emit_event(
-                    "source_fetch",
-                    {
-                        "sub_question_id": sq.id,
-                        "source_name": finding.source_name,
-                        "title": finding.title,
-                        "url": str(finding.url),
-                        "status": "fetched",
-                    },
-                )
+                pending_events.append(_source_fetch_payload(sq.id, finding, "fetched"))
 
                 if budget.global_exhausted() or budget.subquestion_cap_reached(sq.id):
                     break
@@ -394,49 +410,28 @@ async def research_sub_question(
                 len(existing_domains) < MIN_UNIQUE_DOMAINS_PER_SUBQUESTION
                 and not budget.subquestion_cap_reached(sq.id)
             ):
-                for score, finding in scored:
-                    threshold = (
-                        HISTORICAL_ACCEPTANCE_SCORE_THRESHOLD
-                        if intent == "historical"
-                        else ACCEPTANCE_SCORE_THRESHOLD
-                    )
+                for score, url_key, finding in scored:
                     if score < threshold:
-                        continue
-                    accepted, reason = await budget.try_accept(sq.id, finding)
+                        break
+                    accepted, reason = budget.try_accept(sq.id, finding, url_key)
                     if not accepted:
                         if reason == "deduped":
-                            await emit_event(
-                                "source_fetch",
-                                {
-                                    "sub_question_id": sq.id,
-                                    "source_name": finding.source_name,
-                                    "title": finding.title,
-                                    "url": str(finding.url),
-                                    "status": "deduped",
-                                },
-                            )
+                            pending_events.append(_source_fetch_payload(sq.id, finding, "deduped"))
                         continue
-                    url_key = normalize_url(str(finding.url))
                     collected[url_key] = finding
                     existing_domains.add(finding.source_name)
-                    accepted_in_phase += 1
-                    await emit_event(
-                        "source_fetch",
-                        {
-                            "sub_question_id": sq.id,
-                            "source_name": finding.source_name,
-                            "title": finding.title,
-                            "url": str(finding.url),
-                            "status": "fetched",
-                        },
-                    )
+                    pending_events.append(_source_fetch_payload(sq.id, finding, "fetched"))
                     if budget.global_exhausted() or budget.subquestion_cap_reached(sq.id):
                         break
 
-            if phase in {"historical_hint", "broad"} and len(collected) >= 3:
-                break
-            if phase == "broad" and accepted_in_phase > 0 and len(collected) >= 3:
+            if pending_events:
+                await asyncio.gather(*(emit_event("source_fetch", payload) for payload in pending_events))
+
+            # Enough evidence for this query; skip its remaining phases.
+            if len(collected) >= 3:
                 break
+        if call_cap_hit:
+            break
 
     findings_list = list(collected.values())
     synthesis = await _synthesize_research(sq, findings_list)
@@ -462,16 +457,22 @@ async def research_sub_question(
 
 
 def _merge_note(old: ResearchNote, new: ResearchNote) -> ResearchNote:
-    merged_findings: OrderedDict[str, SourceFinding] = OrderedDict()
-    for item in old.findings + new.findings:
-        merged_findings[normalize_url(str(item.url))] = item
+    # The budget manager already rejects URLs from earlier notes, so first occurrence wins.
+    seen: set[str] = set()
+    merged_findings: list[SourceFinding] = []
+    for item in chain(old.findings, new.findings):
+        url_key = normalize_url(str(item.url))
+        if url_key in seen:
+            continue
+        seen.add(url_key)
+        merged_findings.append(item)
     evidence = (old.evidence_bullets + new.evidence_bullets)[:8]
     contradictions = list(dict.fromkeys(old.contradictions + new.contradictions))[:6]
     gaps = list(dict.fromkeys(old.gaps + new.gaps))[:6]
     return ResearchNote(
         sub_question_id=old.sub_question_id,
         evidence_bullets=evidence,
-        findings=list(merged_findings.values()),
+        findings=merged_findings,
         contradictions=contradictions,
         gaps=gaps,
     )
@@ -502,11 +503,11 @@ async def run_research_batch(
                 intent=intent,
             )
 
-    tasks = [_worker(sq) for sq in sorted(sub_questions, key=lambda s: s.priority)]
+    tasks = [_worker(sq) for sq in sorted(sub_questions, key=attrgetter("priority"))]
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
     merged_notes = dict(existing_notes or {})
-    citations_map: OrderedDict[str, Citation] = OrderedDict()
+    citations_map: dict[str, Citation] = {}
     errors: list[dict] = []
 
     for result in results:
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import textwrap
+from itertools import islice
 from typing import Awaitable, Callable
 
-from app.config import MAX_ACCEPTED_SOURCES_TOTAL
+import orjson
+
+from app.config import MAX_ACCEPTED_SOURCES_TOTAL, USE_STRUCTURED_SUMMARY_CALL
 from app.models import Citation, FinalReport
 from app.services.llm import call_openai_typed, stream_openai_text
+from app.text import collapsed_prefix
 
 EmitEvent = Callable[[str, dict], Awaitable[None]]
 
@@ -28,29 +32,91 @@ REQUIRED_HEADERS = (
     "Limitations and Assumptions",
 )
 
-
-def _chunk_text(text: str, chunk_size: int = 450) -> list[str]:
-    return [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)] or [""]
+MESSAGE_CHUNK_CHARS = 200
+MESSAGE_FLUSH_SECONDS = 0.05
+
+_EMPTY: tuple = ()
+
+_BULLET_PREFIXES = ("- ", "* ", "\u2022 ")
+
+_REPORT_TEMPLATE = textwrap.dedent(
+    """
+    Query:
+    {query}
+
+    Rewrite iteration:
+    {rewrite_iteration}
+
+    Quality feedback to address:
+    {quality_feedback}
+
+    Evidence packet (JSON):
+    {notes_json}
+
+    Conversation memory (JSON):
+    {history_json}
+
+    Shared memory (JSON):
+    {memory_json}
+
+    Citation anchors (JSON):
+    {citations_json}
+
+    Output requirements:
+    - Plain text only
+    - Max 850 words total
+    - Short paragraphs; prefer bullets where possible
+    - Use EXACT section headers and separators:
+      Context
+      -------
+      Findings by Sub-Question
+      ------------------------
+      Contradictions and Gaps
+      -----------------------
+      Actionable Takeaways
+      --------------------
+      Limitations and Assumptions
+      ---------------------------
+    - Within findings, max 3 bullets per sub-question
+    - Use citation anchors like [S1], [S2] inline
+    - If evidence packet is sparse but conversation memory contains direct context,
+      answer from conversation memory and state that explicitly.
+    """
+).strip()
+
+_SUMMARY_TEMPLATE = textwrap.dedent(
+    """
+    Query:
+    {query}
+
+    Report body:
+    {report}
+
+    Output requirements:
+    - executive_summary: 5-8 concise lines
+    - key_takeaways: 4-8 actionable bullets
+    - limitations: include ambiguity + gaps + any failures
+    """
+).strip()
 
 
 def _compress_research_notes(research_notes: dict) -> dict:
     compressed: dict[str, dict] = {}
-    for sub_id in sorted(research_notes.keys()):
+    for sub_id in sorted(research_notes):
         note = research_notes[sub_id]
-        findings = note.get("findings", [])[:3]
         compressed[sub_id] = {
-            "evidence_bullets": note.get("evidence_bullets", [])[:5],
+            "evidence_bullets": (note.get("evidence_bullets") or _EMPTY)[:5],
             "findings": [
                 {
                     "title": finding.get("title", ""),
                     "url": finding.get("url", ""),
-                    "snippet": (finding.get("snippet", "") or "")[:220],
+                    "snippet": (finding.get("snippet") or "")[:220],
                     "source_name": finding.get("source_name", "unknown"),
                 }
-                for finding in findings
+                for finding in islice(note.get("findings") or _EMPTY, 3)
             ],
-            "contradictions": note.get("contradictions", [])[:3],
-            "gaps": note.get("gaps", [])[:3],
+            "contradictions": (note.get("contradictions") or _EMPTY)[:3],
+            "gaps": (note.get("gaps") or _EMPTY)[:3],
         }
     return compressed
 
@@ -61,10 +127,10 @@ def _compress_history(history: list[dict[str, str]] | None) -> list[dict[str, st
     out: list[dict[str, str]] = []
     for item in history[-8:]:
         role = str(item.get("role", "user"))
-        content = " ".join(str(item.get("content", "")).split())
+        content = collapsed_prefix(str(item.get("content", "")), 280)
         if not content:
             continue
-        out.append({"role": role, "content": content[:280]})
+        out.append({"role": role, "content": content})
     return out
 
 
@@ -84,17 +150,16 @@ def _build_citation_anchors(citations: list[Citation]) -> list[dict]:
 
 
 def _fallback_report(query: str, packet: dict, anchored_citations: list[dict]) -> FinalReport:
-    sections: list[str] = []
-    sections.append("Context")
-    sections.append("-------")
-    sections.append(f"Research completed with partial synthesis for query: {query}")
-
-    sections.append("\nFindings by Sub-Question")
-    sections.append("------------------------")
+    sections: list[str] = [
+        "Context",
+        "-------",
+        f"Research completed with partial synthesis for query: {query}",
+        "\nFindings by Sub-Question",
+        "------------------------",
+    ]
     for sub_id, note in packet.items():
-        sections.append(f"{sub_id.upper()}")
-        for bullet in note.get("evidence_bullets", [])[:3]:
-            sections.append(f"- {bullet}")
+        sections.append(sub_id.upper())
+        sections.extend(f"- {bullet}" for bullet in note.get("evidence_bullets", [])[:3])
 
     sections.append("\nContradictions and Gaps")
     sections.append("-----------------------")
@@ -102,25 +167,30 @@ def _fallback_report(query: str, packet: dict, anchored_citations: list[dict]) -
         contradictions = note.get("contradictions", [])
         gaps = note.get("gaps", [])
         if contradictions:
-            sections.append(f"{sub_id.upper()} contradictions: " + "; ".join(contradictions[:2]))
+            sections.append(f"{sub_id.upper()} contradictions: {'; '.join(contradictions[:2])}")
         if gaps:
-            sections.append(f"{sub_id.upper()} gaps: " + "; ".join(gaps[:2]))
-
-    sections.append("\nActionable Takeaways")
-    sections.append("--------------------")
-    sections.append("- Prioritize decisions with strongest cross-source support.")
-    sections.append("- Validate high-impact assumptions with primary institutional sources.")
-
-    sections.append("\nLimitations and Assumptions")
-    sections.append("---------------------------")
-    sections.append("- Writer fallback was used, so narrative quality may be reduced.")
-    sections.append("- Some sub-questions may require additional source coverage.")
+            sections.append(f"{sub_id.upper()} gaps: {'; '.join(gaps[:2])}")
+
+    sections.extend(
+        (
+            "\nActionable Takeaways",
+            "--------------------",
+            "- Prioritize decisions with strongest cross-source support.",
+            "- Validate high-impact assumptions with primary institutional sources.",
+            "\nLimitations and Assumptions",
+            "---------------------------",
+            "- Writer fallback was used, so narrative quality may be reduced.",
+            "- Some sub-questions may require additional source coverage.",
+        )
+    )
 
     if anchored_citations:
         sections.append("\nSource Anchors")
         sections.append("--------------")
-        for source in anchored_citations:
-            sections.append(f"[{source['anchor']}] {source['source_name']} - {source['title']}")
+        sections.extend(
+            f"[{source['anchor']}] {source['source_name']} - {source['title']}"
+            for source in anchored_citations
+        )
 
     return FinalReport(
         executive_summary="Partial synthesis generated using fallback formatter due to writer model failure.",
@@ -134,6 +204,33 @@ def _fallback_report(query: str, packet: dict, anchored_citations: list[dict]) -
     )
 
 
+def _build_report_prompt(
+    *,
+    query: str,
+    compressed_notes: dict,
+    anchored_citations: list[dict],
+    conversation_history: list[dict[str, str]],
+    shared_memory: dict | None,
+    quality_feedback: list[str] | None,
+    rewrite_iteration: int,
+) -> str:
+    return _REPORT_TEMPLATE.format_map(
+        {
+            "query": query,
+            "rewrite_iteration": rewrite_iteration,
+            "quality_feedback": orjson.dumps(quality_feedback or []).decode(),
+            "notes_json": orjson.dumps(
+                compressed_notes, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode(),
+            "history_json": orjson.dumps(conversation_history).decode(),
+            "memory_json": orjson.dumps(
+                shared_memory or {}, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode(),
+            "citations_json": orjson.dumps(anchored_citations).decode(),
+        }
+    )
+
+
 async def _stream_report_text(
     *,
     query: str,
@@ -145,62 +242,75 @@ async def _stream_report_text(
     rewrite_iteration: int,
     emit_event: EmitEvent,
 ) -> str:
-    notes_json = json.dumps(compressed_notes, ensure_ascii=False, default=str)
-    citations_json = json.dumps(anchored_citations, ensure_ascii=False)
-    history_json = json.dumps(conversation_history, ensure_ascii=False)
-    memory_json = json.dumps(shared_memory or {}, ensure_ascii=False)
-
-    prompt = textwrap.dedent(
-        f"""
-        Query:
-        {query}
-
-        Rewrite iteration:
-        {rewrite_iteration}
-
-        Quality feedback to address:
-        {json.dumps(quality_feedback or [], ensure_ascii=False)}
-
-        Evidence packet (JSON):
-        {notes_json}
-
-        Conversation memory (JSON):
-        {history_json}
-
-        Shared memory (JSON):
-        {memory_json}
-
-        Citation anchors (JSON):
-        {citations_json}
-
-        Output requirements:
-        - Plain text only
-        - Max 850 words total
-        - Short paragraphs; prefer bullets where possible
-        - Use EXACT section headers and separators:
-          Context\n-------
-          Findings by Sub-Question\n------------------------
-          Contradictions and Gaps\n-----------------------
-          Actionable Takeaways\n--------------------
-          Limitations and Assumptions\n---------------------------
-        - Within findings, max 3 bullets per sub-question
-        - Use citation anchors like [S1], [S2] inline
-        - If evidence packet is sparse but conversation memory contains direct context,
-          answer from conversation memory and state that explicitly.
-        """
-    ).strip()
+    # Shared memory carries recent reports, so keep the dumps off the event loop.
+    prompt = await asyncio.to_thread(
+        _build_report_prompt,
+        query=query,
+        compressed_notes=compressed_notes,
+        anchored_citations=anchored_citations,
+        conversation_history=conversation_history,
+        shared_memory=shared_memory,
+        quality_feedback=quality_feedback,
+        rewrite_iteration=rewrite_iteration,
+    )
 
     chunks: list[str] = []
+    # Coalesce streamed tokens so each SSE message carries a line or ~200 chars, not one token;
+    # the time bound keeps a slow stream from holding text back.
+    loop = asyncio.get_running_loop()
+    pending: list[str] = []
+    pending_len = 0
+    last_flush = loop.time()
     async for token in stream_openai_text(
         system_prompt=REPORT_SYSTEM,
         user_prompt=prompt,
     ):
         chunks.append(token)
-        await emit_event("message", {"chunk": token})
+        pending.append(token)
+        pending_len += len(token)
+        now = loop.time()
+        if (
+            pending_len >= MESSAGE_CHUNK_CHARS
+            or "\n" in token
+            or now - last_flush >= MESSAGE_FLUSH_SECONDS
+        ):
+            await emit_event("message", {"chunk": "".join(pending)})
+            pending.clear()
+            pending_len = 0
+            last_flush = now
+    if pending:
+        await emit_event("message", {"chunk": "".join(pending)})
 
     return "".join(chunks).strip()
 
 
+def _summary_from_report(report_text: str) -> FinalReport | None:
+    sections: dict[str, list[str]] = {header: [] for header in REQUIRED_HEADERS}
+    current: list[str] | None = None
+    for raw_line in report_text.splitlines():
+        line = raw_line.strip()
+        if line in sections:
+            current = sections[line]
+        elif current is not None and line and line.strip("-"):
+            current.append(line)
+
+    def _bullets(lines: list[str]) -> list[str]:
+        return [line[2:].strip() for line in lines if line.startswith(_BULLET_PREFIXES)]
+
+    limitation_lines = sections["Limitations and Assumptions"]
+    summary_lines = sections["Context"][:3] + _bullets(sections["Findings by Sub-Question"])
+    key_takeaways = _bullets(sections["Actionable Takeaways"])[:8]
+    limitations = " ".join(_bullets(limitation_lines) or limitation_lines)
+    if len(summary_lines) < 5 or len(key_takeaways) < 4 or not limitations:
+        return None
+    return FinalReport(
+        executive_summary="\n".join(summary_lines[:8]),
+        report=report_text,
+        key_takeaways=key_takeaways,
+        limitations=limitations,
+    )
+
+
 async def stream_report_chunks(
     query: str,
     research_notes: dict,
@@ -235,20 +345,12 @@ async def stream_report_chunks(
     if report_text and any(header not in report_text for header in REQUIRED_HEADERS):
         report_text = _fallback_report(query, compressed_notes, anchored_citations).report
 
-    summary_prompt = textwrap.dedent(
-        f"""
-        Query:
-        {query}
-
-        Report body:
-        {report_text[:4000]}
+    if report_text and not USE_STRUCTURED_SUMMARY_CALL:
+        parsed = _summary_from_report(report_text)
+        if parsed is not None:
+            return parsed
 
-        Output requirements:
-        - executive_summary: 5-8 concise lines
-        - key_takeaways: 4-8 actionable bullets
-        - limitations: include ambiguity + gaps + any failures
-        """
-    ).strip()
+    summary_prompt = _SUMMARY_TEMPLATE.format_map({"query": query, "report": report_text[:4000]})
 
     try:
         summary = await call_openai_typed(
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import re
+from functools import lru_cache
 
 # Fast research defaults (assignment-safe).
 MAX_SUBQUESTIONS = 6
@@ -22,9 +24,23 @@ MAX_REFINEMENT_LOOPS = 1
 SEARCH_MAX_CALLS_PER_RUN = int(
     os.getenv("SEARCH_MAX_CALLS_PER_RUN", os.getenv("TAVILY_MAX_CALLS_PER_RUN", "40"))
 )
+# Per-provider search result cache; a TTL of 0 disables it.
+SEARCH_CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "600"))
+SEARCH_CACHE_MAX_ENTRIES = 512
+# Keep a copy of every trace event in the run state (they are always streamed live).
+CAPTURE_TRACE_EVENTS = os.getenv("CAPTURE_TRACE_EVENTS", "false").lower() == "true"
+# Process-wide cap on in-flight OpenAI requests, shared by every workflow run.
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "16"))
+# In-flight calls allowed per search provider across all runs in one process.
+PROVIDER_MAX_CONCURRENCY = int(os.getenv("PROVIDER_MAX_CONCURRENCY", "32"))
 TAVILY_FAIL_FAST_ON_QUOTA = os.getenv("TAVILY_FAIL_FAST_ON_QUOTA", "true").lower() == "true"
 USE_EXA_PRIMARY = os.getenv("USE_EXA_PRIMARY", "true").lower() == "true"
 USE_FIRECRAWL_PRIMARY = os.getenv("USE_FIRECRAWL_PRIMARY", "true").lower() == "true"
+# When false, the writer derives the summary fields from a well-formed report body and
+# only calls the LLM summarizer if that parse comes up short.
+USE_STRUCTURED_SUMMARY_CALL = (
+    os.getenv("USE_STRUCTURED_SUMMARY_CALL", "false").lower() == "true"
+)
 
 QUALITY_MIN_TOTAL_SOURCES = 8
 QUALITY_MIN_TRUSTED_RATIO = 0.60
@@ -69,7 +85,7 @@ def _normalize_domain(domain: str) -> str:
 
 def domain_is_tier_a(domain: str) -> bool:
     host = _normalize_domain(domain)
-    return host in TIER_A_DOMAINS or host.endswith(".gov") or host.endswith(".edu")
+    return host in TIER_A_DOMAINS or host.endswith(TRUSTED_SUFFIXES)
 
 
 def domain_is_tier_b(domain: str) -> bool:
@@ -89,51 +105,68 @@ def credibility_score_for_domain(domain: str) -> float:
         return 0.72
     if domain_is_tier_b(host):
         return 0.78
-    if any(host.endswith(suffix) for suffix in TRUSTED_SUFFIXES):
+    if host.endswith(TRUSTED_SUFFIXES):
         return 0.9
     return 0.35
 
 
-def simulated_failure_subquestions() -> set[str]:
+def simulated_failure_subquestions() -> frozenset[str]:
     # Deterministic failure injector for Test Case 3:
     # SIMULATE_RESEARCH_FAILURE_SUBQS=sq2,sq4
-    raw = os.getenv("SIMULATE_RESEARCH_FAILURE_SUBQS", "").strip()
-    if not raw:
-        return set()
-    return {part.strip() for part in raw.split(",") if part.strip()}
+    return _parse_failure_subquestions(os.getenv("SIMULATE_RESEARCH_FAILURE_SUBQS", ""))
+
+
+@lru_cache(maxsize=8)
+def _parse_failure_subquestions(raw: str) -> frozenset[str]:
+    return frozenset(part.strip() for part in raw.split(",") if part.strip())
+
+
+_HISTORICAL_TERMS = (
+    "history",
+    "historical",
+    "origin",
+    "community",
+    "culture",
+    "linguistic",
+    "ethnographic",
+    "biography",
+    "who are",
+    "background",
+    "tradition",
+)
+_BUSINESS_TERMS = (
+    "market",
+    "expand",
+    "investment",
+    "competitor",
+    "regulatory",
+    "infrastructure",
+    "strategy",
+    "risk",
+    "gdp",
+    "inflation",
+    "central bank",
+)
+_INTENT_TERM_BUCKETS = {
+    **dict.fromkeys(_HISTORICAL_TERMS, "historical"),
+    **dict.fromkeys(_BUSINESS_TERMS, "business"),
+}
+# One scan for every intent term; the lookahead lets overlapping terms all match.
+_INTENT_TERM_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(term) for term in sorted(_INTENT_TERM_BUCKETS, key=len, reverse=True))
+    + "))"
+)
 
 
+@lru_cache(maxsize=256)
 def query_intent(query: str) -> str:
-    text = query.lower()
-    historical_terms = {
-        "history",
-        "historical",
-        "origin",
-        "community",
-        "culture",
-        "linguistic",
-        "ethnographic",
-        "biography",
-        "who are",
-        "background",
-        "tradition",
-    }
-    business_terms = {
-        "market",
-        "expand",
-        "investment",
-        "competitor",
-        "regulatory",
-        "infrastructure",
-        "strategy",
-        "risk",
-        "gdp",
-        "inflation",
-        "central bank",
-    }
-
-    hist_hits = sum(1 for term in historical_terms if term in text)
-    biz_hits = sum(1 for term in business_terms if term in text)
+    hist_hits = biz_hits = 0
+    for term in set(_INTENT_TERM_RE.findall(query.lower())):
+        if _INTENT_TERM_BUCKETS[term] == "historical":
+            hist_hits += 1
+        else:
+            biz_hits += 1
 
     if hist_hits > biz_hits:
         return "historical"
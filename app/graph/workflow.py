@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections import OrderedDict
+from functools import lru_cache
 from typing import Any
 
 from langgraph.graph import END, START, StateGraph
@@ -11,7 +11,7 @@ from app.agents.quality import run_quality_check
 from app.agents.researcher import run_research_batch
 from app.agents.writer import stream_report_chunks
 from app.graph.state import GraphState
-from app.models import Citation
+from app.models import Citation, ResearchNote
 from app.services.tracing import trace_end, trace_start, utc_now_iso
 from app.tools.tavily_search import normalize_url
 
@@ -44,18 +44,40 @@ async def _emit_trace(
 
 
 def _dedupe_citations(citations: list[Citation]) -> list[Citation]:
-    output: OrderedDict[str, Citation] = OrderedDict()
+    # Later citations replace earlier ones for the same URL but keep its position.
+    output: dict[str, Citation] = {}
     for citation in citations:
         output[normalize_url(str(citation.url))] = citation
     return list(output.values())
 
 
+def _dump_notes(state: GraphState, research_notes: dict[str, ResearchNote]) -> dict[str, dict]:
+    # Per-run cache: a rewrite pass reuses the dump of every note that refinement didn't
+    # replace. Holding the note itself keeps the identity check valid.
+    cache: dict[str, tuple[ResearchNote, dict]] = state.setdefault("metadata", {}).setdefault(
+        "note_dumps", {}
+    )
+    dumps: dict[str, dict] = {}
+    for key, note in research_notes.items():
+        cached = cache.get(key)
+        if cached is None or cached[0] is not note:
+            cached = (note, note.model_dump(mode="json"))
+            cache[key] = cached
+        dumps[key] = cached[1]
+    return dumps
+
+
 def _ensure_shared_memory(state: GraphState) -> dict[str, Any]:
     shared = state.get("shared_memory") or {}
-    shared.setdefault("thread_id", state.get("thread_id"))
-    shared.setdefault("recent_messages", state.get("history", [])[-12:])
-    shared.setdefault("recent_reports", state.get("report_memories", [])[-6:])
-    shared.setdefault("open_gaps", [])
+    # Every node calls this; only slice history and reports the first time.
+    if "thread_id" not in shared:
+        shared["thread_id"] = state.get("thread_id")
+    if "recent_messages" not in shared:
+        shared["recent_messages"] = state.get("history", [])[-12:]
+    if "recent_reports" not in shared:
+        shared["recent_reports"] = state.get("report_memories", [])[-6:]
+    if "open_gaps" not in shared:
+        shared["open_gaps"] = []
     state["shared_memory"] = shared
     return shared
 
@@ -77,31 +99,18 @@ async def plan_node(state: GraphState) -> GraphState:
             for assumption in (plan.assumptions or [])
         )
         state.setdefault("metadata", {})["skip_web_research"] = skip_web
+        # SubQuestion has exactly the fields the trace detail reports, so dump once for both.
+        sub_questions = [sq.model_dump(mode="json") for sq in plan.sub_questions]
         await _emit_event(
             state,
             "planning",
             {
-                "sub_question_count": len(plan.sub_questions),
-                "sub_questions": [sq.model_dump(mode="json") for sq in plan.sub_questions],
+                "sub_question_count": len(sub_questions),
+                "sub_questions": sub_questions,
                 "skip_web_research": skip_web,
             },
         )
-        await _emit_trace(
-            state,
-            "plan",
-            "detail",
-            extra={
-                "sub_questions": [
-                    {
-                        "id": sq.id,
-                        "priority": sq.priority,
-                        "question": sq.question,
-                        "search_queries": sq.search_queries,
-                    }
-                    for sq in plan.sub_questions
-                ]
-            },
-        )
+        await _emit_trace(state, "plan", "detail", extra={"sub_questions": sub_questions})
         return state
     except Exception as exc:
         state.setdefault("errors", []).append({"stage": "plan", "detail": str(exc)})
@@ -143,25 +152,25 @@ async def research_node(state: GraphState) -> GraphState:
 async def quality_check_node(state: GraphState) -> GraphState:
     t0 = trace_start(state, "quality_check")
     await _emit_trace(state, "quality_check", "start")
+    metadata = state.setdefault("metadata", {})
     try:
         _ensure_shared_memory(state)
+        final_report = state.get("final_report")
         quality = await run_quality_check(
             query=state["query"],
-            report=state.get("final_report").report if state.get("final_report") else "",
-            executive_summary=(
-                state.get("final_report").executive_summary if state.get("final_report") else ""
-            ),
+            report=final_report.report if final_report else "",
+            executive_summary=final_report.executive_summary if final_report else "",
             citations=state.get("citations", []),
         )
         state["quality"] = quality
-        quality_iterations = int(state.get("metadata", {}).get("quality_iterations", 0))
+        quality_iterations = int(metadata.get("quality_iterations", 0))
         needs_rewrite = ENABLE_REFINEMENT and (not quality.passed) and (
             quality_iterations < MAX_REFINEMENT_LOOPS
         )
-        state.setdefault("metadata", {})["needs_rewrite"] = needs_rewrite
+        metadata["needs_rewrite"] = needs_rewrite
         if needs_rewrite:
             state["refinement_used"] = True
-            state.setdefault("metadata", {})["quality_iterations"] = quality_iterations + 1
+            metadata["quality_iterations"] = quality_iterations + 1
             state["quality_feedback"] = quality.issues[:4]
         await _emit_event(
             state,
@@ -176,7 +185,7 @@ async def quality_check_node(state: GraphState) -> GraphState:
     except Exception as exc:
         state.setdefault("errors", []).append({"stage": "quality_check", "detail": str(exc)})
         await _emit_event(state, "error", {"stage": "quality_check", "detail": str(exc)})
-        state.setdefault("metadata", {})["needs_rewrite"] = False
+        metadata["needs_rewrite"] = False
         return state
     finally:
         duration_ms = trace_end(state, "quality_check", t0)
@@ -197,26 +206,31 @@ async def write_report_node(state: GraphState) -> GraphState:
     await _emit_trace(state, "write_report", "start")
     try:
         shared_memory = _ensure_shared_memory(state)
+        research_notes = state.get("research_notes", {})
+        prior_quality = state.get("quality")
         final_report = await stream_report_chunks(
             query=state["query"],
-            research_notes={
-                key: note.model_dump(mode="json")
-                for key, note in state.get("research_notes", {}).items()
-            },
+            research_notes=_dump_notes(state, research_notes),
             citations=state.get("citations", []),
             history=state.get("history", []),
             shared_memory=shared_memory,
-            quality_score=(state.get("quality").score if state.get("quality") else None),
+            quality_score=prior_quality.score if prior_quality else None,
             quality_feedback=state.get("quality_feedback", []),
             rewrite_iteration=rewrite_iteration,
             emit_event=lambda event, data: _emit_event(state, event, data),
         )
         state["final_report"] = final_report
 
-        latest_gaps: list[str] = []
-        for note in state.get("research_notes", {}).values():
-            latest_gaps.extend(note.gaps[:2])
-        shared_memory["open_gaps"] = list(dict.fromkeys(latest_gaps))[:8]
+        open_gaps: list[str] = []
+        seen_gaps: set[str] = set()
+        for note in research_notes.values():
+            for gap in note.gaps[:2]:
+                if gap not in seen_gaps:
+                    seen_gaps.add(gap)
+                    open_gaps.append(gap)
+            if len(open_gaps) >= 8:
+                break
+        shared_memory["open_gaps"] = open_gaps[:8]
         return state
     except Exception as exc:
         state.setdefault("errors", []).append({"stage": "write_report", "detail": str(exc)})
@@ -234,12 +248,21 @@ def quality_router(state: GraphState) -> str:
     return "end"
 
 
+def write_router(state: GraphState) -> str:
+    # Conversational turns answered from memory have no research to grade or rewrite.
+    if state.get("metadata", {}).get("skip_web_research", False):
+        return "end"
+    return "quality_check"
+
+
 def plan_router(state: GraphState) -> str:
     if state.get("metadata", {}).get("skip_web_research", False):
         return "write_report"
     return "research"
 
 
+# The compiled graph holds no per-run state, so every request can share one instance.
+@lru_cache(maxsize=1)
 def build_workflow() -> Any:
     graph = StateGraph(GraphState)
     graph.add_node("plan", plan_node)
@@ -256,7 +279,14 @@ def build_workflow() -> Any:
         },
     )
     graph.add_edge("research", "write_report")
-    graph.add_edge("write_report", "quality_check")
+    graph.add_conditional_edges(
+        "write_report",
+        write_router,
+        {
+            "quality_check": "quality_check",
+            "end": END,
+        },
+    )
     graph.add_conditional_edges(
         "quality_check",
         quality_router,
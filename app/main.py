@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,6 +10,7 @@ from dotenv import load_dotenv
 
 from app.models import ChatRequest
 from app.services.sse import chat_event_stream
+from app.tools.http_client import close_http_client
 
 load_dotenv()
 logging.basicConfig(
@@ -16,7 +18,14 @@ logging.basicConfig(
     format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
 )
 
-app = FastAPI(title="Deep Research Multi-Agent API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    yield
+    await close_http_client()
+
+
+app = FastAPI(title="Deep Research Multi-Agent API", version="0.1.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import os
+from functools import lru_cache
 from typing import TypeVar
 
+import orjson
 from openai import AsyncOpenAI
 from pydantic import BaseModel, ValidationError
 
+from app.config import LLM_MAX_CONCURRENCY
+
 T = TypeVar("T", bound=BaseModel)
 
+_llm_slots = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
 
 class LLMConfigError(RuntimeError):
     pass
@@ -18,16 +24,27 @@ def _get_client() -> AsyncOpenAI:
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise LLMConfigError("OPENAI_API_KEY is not set.")
+    return _client_for_key(api_key)
+
+
+# Reusing the client keeps its connection pool warm, so later calls in a run (and the
+# writer stream in particular) skip the TCP/TLS handshake.
+@lru_cache(maxsize=4)
+def _client_for_key(api_key: str) -> AsyncOpenAI:
     return AsyncOpenAI(api_key=api_key)
 
 
 def _extract_json(content: str) -> dict:
     stripped = content.strip()
     if stripped.startswith("```"):
-        stripped = stripped.strip("`")
+        # Drop only the fence itself; backticks inside the JSON must survive.
+        stripped = stripped[3:]
+        if stripped.endswith("```"):
+            stripped = stripped[:-3]
         if stripped.startswith("json"):
-            stripped = stripped[4:].strip()
-    return json.loads(stripped)
+            stripped = stripped[4:]
+        stripped = stripped.strip()
+    return orjson.loads(stripped)
 
 
 async def call_openai_json(
@@ -38,19 +55,24 @@ async def call_openai_json(
 ) -> dict:
     client = _get_client()
     selected_model = model or os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
-    response = await client.chat.completions.create(
-        model=selected_model,
-        temperature=0.2,
-        response_format={"type": "json_object"},
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-    )
+    async with _llm_slots:
+        response = await client.chat.completions.create(
+            model=selected_model,
+            temperature=0.2,
+            response_format={"type": "json_object"},
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        )
     content = response.choices[0].message.content
     if not content:
         return {}
-    return _extract_json(content)
+    # json_object mode almost always returns bare JSON; only unwrap fences on failure.
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return _extract_json(content)
 
 
 async def call_openai_typed(
@@ -79,20 +101,22 @@ async def stream_openai_text(
 ):
     client = _get_client()
     selected_model = model or os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
-    response = await client.chat.completions.create(
-        model=selected_model,
-        temperature=0.2,
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-        stream=True,
-    )
-    async for chunk in response:
-        try:
-            delta = chunk.choices[0].delta
-        except (AttributeError, IndexError):
-            continue
-        content = getattr(delta, "content", None)
-        if content:
-            yield content
+    # A streamed response occupies its slot until the last token arrives.
+    async with _llm_slots:
+        response = await client.chat.completions.create(
+            model=selected_model,
+            temperature=0.2,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            stream=True,
+        )
+        async for chunk in response:
+            try:
+                delta = chunk.choices[0].delta
+            except (AttributeError, IndexError):
+                continue
+            content = getattr(delta, "content", None)
+            if content:
+                yield content
@@ -1,16 +1,40 @@
 from __future__ import annotations
 
 import asyncio
-import json
+from collections import deque
 
+import orjson
+
+from app.config import CAPTURE_TRACE_EVENTS
 from app.graph.workflow import build_workflow
 from app.models import DoneMetadata, DonePayload
 from app.services.thread_store import thread_store
 from app.services.tracing import utc_now_iso
 
+SSE_BATCH_MAX_BYTES = 16_384
+
+
+_EVENT_PREFIXES = {
+    name: f"event: {name}\ndata: ".encode()
+    for name in (
+        "thread_id",
+        "planning",
+        "research_progress",
+        "source_fetch",
+        "writing",
+        "message",
+        "quality",
+        "trace",
+        "error",
+        "done",
+    )
+}
+
 
-def sse_event(event: str, data: dict) -> str:
-    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+def sse_event(event: str, data: dict) -> bytes:
+    # Frames stay bytes end to end so StreamingResponse doesn't re-encode every chunk.
+    prefix = _EVENT_PREFIXES.get(event) or f"event: {event}\ndata: ".encode()
+    return prefix + orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
 
 
 async def chat_event_stream(message: str, thread_id: str | None):
@@ -18,12 +42,16 @@ async def chat_event_stream(message: str, thread_id: str | None):
     await thread_store.append_message(resolved_thread_id, "user", message)
     yield sse_event("thread_id", {"thread_id": resolved_thread_id})
 
-    queue: asyncio.Queue[str] = asyncio.Queue()
+    # Single producer (the workflow) and single consumer (this generator), so a deque plus
+    # a wakeup event is all the bridge needs.
+    pending_frames: deque[bytes] = deque()
+    frames_ready = asyncio.Event()
 
     async def emit(event: str, data: dict) -> None:
         # If upstream already passed thread_id, keep it; otherwise include it.
         payload = data if "thread_id" in data else {"thread_id": resolved_thread_id, **data}
-        await queue.put(sse_event(event, payload))
+        pending_frames.append(sse_event(event, payload))
+        frames_ready.set()
 
     prior_context = ""
     report_memories = prior_state.get("report_memories", []) or []
@@ -83,20 +111,37 @@ async def chat_event_stream(message: str, thread_id: str | None):
         "runtime": {
             "emit_event": emit,
             "max_concurrency": 4,
+            "capture_traces": CAPTURE_TRACE_EVENTS,
         },
     }
 
     workflow = build_workflow()
     workflow_task = asyncio.create_task(workflow.ainvoke(initial_state))
 
-    while True:
-        if workflow_task.done() and queue.empty():
-            break
-        try:
-            item = await asyncio.wait_for(queue.get(), timeout=0.25)
-            yield item
-        except asyncio.TimeoutError:
-            continue
+    # Wake on either a new frame or workflow completion, then flush every frame already
+    # queued as one chunk so bursts of trace events don't become one write each.
+    ready_task: asyncio.Task[bool] | None = None
+    try:
+        while True:
+            if not pending_frames:
+                if workflow_task.done():
+                    break
+                frames_ready.clear()
+                ready_task = asyncio.create_task(frames_ready.wait())
+                await asyncio.wait({ready_task, workflow_task}, return_when=asyncio.FIRST_COMPLETED)
+                ready_task.cancel()
+                ready_task = None
+                continue
+            frames: list[bytes] = []
+            batch_bytes = 0
+            while pending_frames and batch_bytes < SSE_BATCH_MAX_BYTES:
+                frame = pending_frames.popleft()
+                frames.append(frame)
+                batch_bytes += len(frame)
+            yield b"".join(frames)
+    finally:
+        if ready_task is not None:
+            ready_task.cancel()
 
     try:
         final_state = await workflow_task
@@ -124,7 +169,8 @@ async def chat_event_stream(message: str, thread_id: str | None):
         return
 
     citations = final_state.get("citations", [])
-    metadata = DoneMetadata(
+    # Everything below comes from validated workflow models, so skip re-validation.
+    metadata = DoneMetadata.model_construct(
         sub_question_count=len(final_state.get("plan").sub_questions) if final_state.get("plan") else 0,
         sources_analyzed=len(citations),
         completion_timestamp=utc_now_iso(),
@@ -132,7 +178,7 @@ async def chat_event_stream(message: str, thread_id: str | None):
         refinement_used=final_state.get("refinement_used", False),
         timings_ms=final_state.get("metadata", {}).get("timings_ms", {}),
     )
-    done = DonePayload(
+    done = DonePayload.model_construct(
         thread_id=resolved_thread_id,
         query=message,
         executive_summary=final_report.executive_summary,
@@ -25,7 +25,7 @@ class ThreadStore:
             report_memories = self._threads[resolved_id].get("report_memories", [])
             merged_state: GraphState = dict(state)
             merged_state["history"] = list(history)
-            merged_state["report_memories"] = list(report_memories)
+            merged_state["report_memories"] = report_memories
             merged_state["thread_id"] = resolved_id
             return resolved_id, merged_state
 
@@ -44,9 +44,9 @@ class ThreadStore:
                 {"history": [], "state": {}, "report_memories": []},
             )
             memories = self._threads[thread_id]["report_memories"]
-            memories.append(memory)
-            # Keep recent history bounded for in-memory usage.
-            self._threads[thread_id]["report_memories"] = memories[-12:]
+            # Keep recent history bounded for in-memory usage. Build a new list rather than
+            # appending so snapshots handed out by get_or_create/get_state never change.
+            self._threads[thread_id]["report_memories"] = [*memories[-11:], memory]
 
     async def save_state(self, thread_id: str, state: GraphState) -> None:
         async with self._lock:
@@ -67,7 +67,7 @@ class ThreadStore:
             )
             out: GraphState = dict(thread.get("state", {}))
             out["history"] = list(thread.get("history", []))
-            out["report_memories"] = list(thread.get("report_memories", []))
+            out["report_memories"] = thread.get("report_memories", [])
             out["thread_id"] = thread_id
             return out
 
@@ -1,17 +1,29 @@
 from __future__ import annotations
 
 import time
-from datetime import datetime, timezone
+
+# Timestamps have second resolution, so a node's burst of trace events can share one string.
+_last_ts: tuple[int, str] = (-1, "")
 
 
 def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    global _last_ts
+    now = int(time.time())
+    if now != _last_ts[0]:
+        _last_ts = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+    return _last_ts[1]
+
+
+def _capturing(state: dict) -> bool:
+    # Trace events are streamed live; keeping a copy in state is only useful when debugging.
+    return state.get("runtime", {}).get("capture_traces", False)
 
 
 def trace_start(state: dict, node: str) -> float:
-    if "trace_events" not in state:
-        state["trace_events"] = []
-    state["trace_events"].append({"node": node, "status": "start", "timestamp": utc_now_iso()})
+    if _capturing(state):
+        state.setdefault("trace_events", []).append(
+            {"node": node, "status": "start", "timestamp": utc_now_iso()}
+        )
     return time.perf_counter()
 
 
@@ -24,13 +36,14 @@ def trace_end(
     extra: dict | None = None,
 ) -> int:
     duration_ms = int((time.perf_counter() - t0) * 1000)
-    event = {
-        "node": node,
-        "status": status,
-        "timestamp": utc_now_iso(),
-        "duration_ms": duration_ms,
-        "extra": extra or {},
-    }
-    state.setdefault("trace_events", []).append(event)
+    if _capturing(state):
+        event = {
+            "node": node,
+            "status": status,
+            "timestamp": utc_now_iso(),
+            "duration_ms": duration_ms,
+            "extra": extra or {},
+        }
+        state.setdefault("trace_events", []).append(event)
     state.setdefault("metadata", {}).setdefault("timings_ms", {})[node] = duration_ms
     return duration_ms
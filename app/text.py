@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import re
+
+WS_RE = re.compile(r"\s+")
+_TOKEN_RE = re.compile(r"\S+")
+
+
+def collapsed_prefix(text: str, limit: int) -> str:
+    # Same as " ".join(text.split())[:limit], but stops scanning once enough words are in.
+    words: list[str] = []
+    size = -1
+    for match in _TOKEN_RE.finditer(text):
+        word = match.group()
+        words.append(word)
+        size += len(word) + 1
+        if size >= limit:
+            break
+    return " ".join(words)[:limit]
@@ -3,8 +3,12 @@ from __future__ import annotations
 import os
 
 import httpx
+import orjson
 
 from app.models import SourceFinding
+from app.text import WS_RE
+from app.tools.http_client import get_http_client, limit_concurrency, post_with_retries
+from app.tools.search_cache import cached_search
 from app.tools.tavily_search import extract_source_name
 
 
@@ -12,10 +16,16 @@ class ExaSearchError(RuntimeError):
     pass
 
 
+SNIPPET_MAX_CHARS = 1200
+_TIMEOUT = httpx.Timeout(20.0, connect=8.0)
+
+
 def _clean_query(query: str) -> str:
-    return " ".join(query.split()).strip()[:450]
+    return WS_RE.sub(" ", query).strip()[:450]
 
 
+@cached_search
+@limit_concurrency
 async def exa_search(
     query: str,
     max_results: int = 5,
@@ -29,21 +39,26 @@ async def exa_search(
         "query": _clean_query(query),
         "type": "auto",
         "numResults": max(1, min(max_results, 10)),
-        "contents": {"text": True},
+        # Snippets are truncated anyway, so don't ship full page text over the wire.
+        "contents": {"text": {"maxCharacters": SNIPPET_MAX_CHARS}},
     }
     if include_domains:
         payload["includeDomains"] = include_domains[:10]
 
-    timeout = httpx.Timeout(20.0, connect=8.0)
     headers = {
         "x-api-key": api_key,
         "Content-Type": "application/json",
     }
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post("https://api.exa.ai/search", json=payload, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        response = await post_with_retries(
+            get_http_client(),
+            "https://api.exa.ai/search",
+            json=payload,
+            headers=headers,
+            timeout=_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
     except Exception as exc:
         raise ExaSearchError(f"Exa request failed: {exc}") from exc
 
@@ -58,7 +73,7 @@ async def exa_search(
             SourceFinding(
                 title=str(title)[:300],
                 url=str(url),
-                snippet=str(snippet or f"Summary unavailable for {title}")[:1200],
+                snippet=str(snippet or f"Summary unavailable for {title}")[:SNIPPET_MAX_CHARS],
                 source_name=extract_source_name(str(url)),
             )
         )
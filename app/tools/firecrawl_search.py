@@ -3,8 +3,12 @@ from __future__ import annotations
 import os
 
 import httpx
+import orjson
 
 from app.models import SourceFinding
+from app.text import WS_RE
+from app.tools.http_client import get_http_client, limit_concurrency, post_with_retries
+from app.tools.search_cache import cached_search
 from app.tools.tavily_search import extract_source_name
 
 
@@ -12,8 +16,11 @@ class FirecrawlSearchError(RuntimeError):
     pass
 
 
+_TIMEOUT = httpx.Timeout(20.0, connect=8.0)
+
+
 def _clean_query(query: str) -> str:
-    return " ".join(query.split()).strip()[:450]
+    return WS_RE.sub(" ", query).strip()[:450]
 
 
 def _domain_hint_query(query: str, include_domains: list[str] | None) -> str:
@@ -27,6 +34,8 @@ def _domain_hint_query(query: str, include_domains: list[str] | None) -> str:
     return f"{query} ({hints})"
 
 
+@cached_search
+@limit_concurrency
 async def firecrawl_search(
     query: str,
     max_results: int = 5,
@@ -41,20 +50,20 @@ async def firecrawl_search(
         "limit": max(1, min(max_results, 10)),
     }
 
-    timeout = httpx.Timeout(20.0, connect=8.0)
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                "https://api.firecrawl.dev/v1/search",
-                json=payload,
-                headers=headers,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await post_with_retries(
+            get_http_client(),
+            "https://api.firecrawl.dev/v1/search",
+            json=payload,
+            headers=headers,
+            timeout=_TIMEOUT,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
     except Exception as exc:
         raise FirecrawlSearchError(f"Firecrawl request failed: {exc}") from exc
 
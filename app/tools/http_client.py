@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import importlib.util
+import random
+from typing import Any, Awaitable, Callable, TypeVar
+
+import httpx
+
+from app.config import PROVIDER_MAX_CONCURRENCY
+
+# One pooled client per process so searches across every provider reuse open TLS
+# connections. Providers pass their own timeouts per request. With h2 installed
+# (httpx[http2]) parallel calls and retries to one host multiplex over a single
+# connection instead of opening one per request.
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_DEFAULT_TIMEOUT = httpx.Timeout(20.0, connect=8.0)
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(timeout=_DEFAULT_TIMEOUT, limits=_LIMITS, http2=_HTTP2)
+    return _client
+
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+T = TypeVar("T")
+
+
+def limit_concurrency(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    # Extra calls queue here instead of piling up as pool timeouts inside httpx. A call keeps
+    # its slot through post_with_retries' backoff sleeps on purpose: a provider that is
+    # rate limiting us gets fewer new requests until it recovers.
+    slots = asyncio.Semaphore(PROVIDER_MAX_CONCURRENCY)
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        async with slots:
+            return await fn(*args, **kwargs)
+
+    return wrapper
+
+
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+async def post_with_retries(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    attempts: int = 3,
+    base_delay: float = 0.5,
+    **kwargs: Any,
+) -> httpx.Response:
+    # Retry only transient failures (rate limits, gateway errors, dropped connections)
+    # with exponential backoff plus jitter; the final attempt's outcome is returned as is.
+    for attempt in range(attempts - 1):
+        try:
+            response = await client.post(url, **kwargs)
+            if response.status_code not in RETRYABLE_STATUS:
+                return response
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(base_delay * (2**attempt) + random.uniform(0, base_delay))
+    return await client.post(url, **kwargs)
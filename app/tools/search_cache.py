@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from app.config import SEARCH_CACHE_MAX_ENTRIES, SEARCH_CACHE_TTL_SECONDS
+from app.models import SourceFinding
+
+SearchFn = Callable[..., Awaitable[list[SourceFinding]]]
+
+
+def cached_search(fn: SearchFn) -> SearchFn:
+    # Per-provider TTL LRU: identical queries within a session (and across nearby
+    # sessions) skip the outbound request. Failures are never cached.
+    cache: OrderedDict[tuple, tuple[float, list[SourceFinding]]] = OrderedDict()
+
+    @functools.wraps(fn)
+    async def wrapper(query: str, max_results: int = 5, **kwargs: Any) -> list[SourceFinding]:
+        if SEARCH_CACHE_TTL_SECONDS <= 0:
+            return await fn(query, max_results, **kwargs)
+        domains = kwargs.get("include_domains")
+        key = (" ".join(query.split()), max_results, tuple(sorted(domains)) if domains else ())
+        now = time.monotonic()
+        hit = cache.get(key)
+        if hit is not None and hit[0] > now:
+            cache.move_to_end(key)
+            return list(hit[1])
+
+        findings = await fn(query, max_results, **kwargs)
+        cache[key] = (now + SEARCH_CACHE_TTL_SECONDS, findings)
+        cache.move_to_end(key)
+        if len(cache) > SEARCH_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+        return list(findings)
+
+    wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+    return wrapper
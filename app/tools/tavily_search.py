@@ -1,19 +1,29 @@
 from __future__ import annotations
 
 import os
+import re
+from functools import lru_cache
+from typing import Iterator
 from urllib.parse import urlparse, urlunparse
 
 import httpx
+import orjson
 
 from app.models import SourceFinding
+from app.text import WS_RE
+from app.tools.http_client import get_http_client, limit_concurrency
+from app.tools.search_cache import cached_search
 
 
 class SearchToolError(RuntimeError):
     pass
 
 
+_TIMEOUT = httpx.Timeout(25.0, connect=10.0)
+
+
 def _sanitize_query(query: str) -> str:
-    return " ".join(query.split()).strip()[:450]
+    return WS_RE.sub(" ", query).strip()[:450]
 
 
 def _sanitize_domains(domains: list[str] | None) -> list[str]:
@@ -36,18 +46,39 @@ def _sanitize_domains(domains: list[str] | None) -> list[str]:
             continue
         seen.add(host)
         cleaned.append(host)
-    return cleaned[:20]
+        if len(cleaned) == 20:
+            break
+    return cleaned
+
+
+# Covers the common "http(s)://host/path" shape in one match; anything unusual (params,
+# whitespace, IPv6 literals, other schemes) falls back to urllib.
+_HTTP_URL_RE = re.compile(
+    r"https?://([^/?#;\[\]\s]+)((?:/[^/?#;\[\]\s]*)*)(?=[?#]|$)", re.IGNORECASE
+)
 
 
 def extract_source_name(url: str) -> str:
-    host = urlparse(url).netloc.lower()
+    match = _HTTP_URL_RE.match(url)
+    host = match.group(1).lower() if match else urlparse(url).netloc.lower()
     if host.startswith("www."):
         host = host[4:]
     return host or "unknown"
 
 
+# Normalized on every dedupe/accept step; the same URLs recur across phases and merges.
+@lru_cache(maxsize=8192)
 def normalize_url(url: str) -> str:
-    parsed = urlparse(url.strip())
+    stripped = url.strip()
+    match = _HTTP_URL_RE.match(stripped)
+    if match:
+        netloc = match.group(1).lower()
+        if netloc.startswith("www."):
+            netloc = netloc[4:]
+        if netloc:
+            return f"https://{netloc}{match.group(2)}".rstrip("/")
+
+    parsed = urlparse(stripped)
     netloc = parsed.netloc.lower()
     if netloc.startswith("www."):
         netloc = netloc[4:]
@@ -61,6 +92,21 @@ def normalize_url(url: str) -> str:
     return urlunparse(normalized).rstrip("/")
 
 
+def _attempt_payloads(base: dict[str, object]) -> Iterator[dict[str, object]]:
+    # Tavily behavior can vary by account/config. Try a small retry ladder:
+    # 1) advanced + include_domains
+    # 2) advanced without include_domains
+    # 3) basic without include_domains
+    # Variants are only built once the previous attempt has failed.
+    yield base
+    if "include_domains" in base:
+        base = {key: value for key, value in base.items() if key != "include_domains"}
+        yield base
+    yield {**base, "search_depth": "basic"}
+
+
+@cached_search
+@limit_concurrency
 async def tavily_search(
     query: str,
     max_results: int = 5,
@@ -88,60 +134,41 @@ async def tavily_search(
         "include_answer": False,
         "include_images": False,
         "include_raw_content": False,
+        # Backward-compatible body auth for older API behavior.
+        "api_key": api_key,
     }
     if sanitized_domains:
         base_payload["include_domains"] = sanitized_domains
-    timeout = httpx.Timeout(25.0, connect=10.0)
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {api_key}",
     }
 
-    # Tavily behavior can vary by account/config. Try a small retry ladder:
-    # 1) advanced + include_domains
-    # 2) advanced without include_domains
-    # 3) basic without include_domains
-    attempts: list[dict[str, object]] = []
-    first = dict(base_payload)
-    attempts.append(first)
-
-    if "include_domains" in base_payload:
-        no_domains = dict(base_payload)
-        no_domains.pop("include_domains", None)
-        attempts.append(no_domains)
-
-    basic = dict(base_payload)
-    basic.pop("include_domains", None)
-    basic["search_depth"] = "basic"
-    attempts.append(basic)
-
     errors: list[str] = []
     data: dict = {}
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        for idx, payload in enumerate(attempts, start=1):
-            request_payload = dict(payload)
-            # Backward-compatible body auth for older API behavior.
-            request_payload["api_key"] = api_key
-            try:
-                response = await client.post(
-                    "https://api.tavily.com/search",
-                    json=request_payload,
-                    headers=headers,
+    client = get_http_client()
+    for idx, payload in enumerate(_attempt_payloads(base_payload), start=1):
+        try:
+            response = await client.post(
+                "https://api.tavily.com/search",
+                json=payload,
+                headers=headers,
+                timeout=_TIMEOUT,
+            )
+            if response.status_code >= 400:
+                body = response.text.strip()
+                if len(body) > 240:
+                    body = body[:240] + "..."
+                errors.append(
+                    f"attempt={idx} status={response.status_code} depth={payload.get('search_depth')} "
+                    f"domains={'include_domains' in payload} body={body or '(empty)'}"
                 )
-                if response.status_code >= 400:
-                    body = response.text.strip()
-                    if len(body) > 240:
-                        body = body[:240] + "..."
-                    errors.append(
-                        f"attempt={idx} status={response.status_code} depth={payload.get('search_depth')} "
-                        f"domains={'include_domains' in payload} body={body or '(empty)'}"
-                    )
-                    continue
-                data = response.json()
-                break
-            except httpx.HTTPError as exc:
-                errors.append(f"attempt={idx} exception={exc}")
                 continue
+            data = orjson.loads(response.content)
+            break
+        except httpx.HTTPError as exc:
+            errors.append(f"attempt={idx} exception={exc}")
+            continue
 
     if not data:
         raise SearchToolError("Tavily request failed after retries: " + " | ".join(errors))
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from collections import OrderedDict
+from itertools import chain, zip_longest
 
 from app.models import SourceFinding
 from app.tools.exa_search import exa_search
@@ -12,6 +12,8 @@ from app.tools.tavily_search import SearchToolError, normalize_url, tavily_searc
 
 logger = logging.getLogger("app.search")
 
+PROVIDER_GRACE_SECONDS = 3.0
+
 
 def _enabled(value: str | None, default: bool = True) -> bool:
     if value is None:
@@ -62,32 +64,52 @@ async def search_web_parallel(
             )
         )
 
-    findings_by_url: OrderedDict[str, SourceFinding] = OrderedDict()
+    findings_by_url: dict[str, SourceFinding] = {}
     provider_findings: dict[str, list[SourceFinding]] = {}
     errors: list[str] = []
 
     if tasks:
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        for idx, result in enumerate(results):
-            if isinstance(result, Exception):
-                errors.append(f"{labels[idx]}: {result}")
-                logger.warning("search.provider_error provider=%s error=%s", labels[idx], result)
-                continue
-            logger.info("search.provider_ok provider=%s results=%s", labels[idx], len(result))
-            provider_findings[labels[idx]] = list(result)
-
-    # Interleave provider results to reduce one-provider/domain dominance.
-    interleaved: list[SourceFinding] = []
-    if provider_findings:
-        max_len = max(len(items) for items in provider_findings.values())
-        for i in range(max_len):
-            for label in labels:
-                items = provider_findings.get(label, [])
-                if i < len(items):
-                    interleaved.append(items[i])
-
+        # Don't let the slowest provider gate the search: once one provider has answered,
+        # give the rest a short grace period (or stop early if we already have plenty).
+        label_by_task = dict(zip(tasks, labels))
+        loop = asyncio.get_running_loop()
+        deadline: float | None = None
+        pending = set(tasks)
+        try:
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - loop.time())
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for task in done:
+                    label = label_by_task[task]
+                    exc = task.exception()
+                    if exc is not None:
+                        errors.append(f"{label}: {exc}")
+                        logger.warning("search.provider_error provider=%s error=%s", label, exc)
+                        continue
+                    result = task.result()
+                    logger.info("search.provider_ok provider=%s results=%s", label, len(result))
+                    provider_findings[label] = list(result)
+                collected = sum(len(items) for items in provider_findings.values())
+                if collected >= max_results * 2:
+                    break
+                if collected and deadline is None:
+                    deadline = loop.time() + PROVIDER_GRACE_SECONDS
+        finally:
+            for task in pending:
+                task.cancel()
+                logger.info("search.provider_cancelled provider=%s", label_by_task[task])
+
+    # Interleave provider results round-robin to reduce one-provider/domain dominance,
+    # deduping and capping per domain in the same pass.
     domain_counts: dict[str, int] = {}
-    for finding in interleaved:
+    ranked = [provider_findings[label] for label in labels if label in provider_findings]
+    for finding in chain.from_iterable(zip_longest(*ranked)):
+        if finding is None:
+            continue
         normalized = normalize_url(str(finding.url))
         if normalized in findings_by_url:
             continue
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import html
 import os
 import re
 from urllib.parse import quote
 
 import httpx
+import orjson
 
 from app.models import SourceFinding
+from app.text import WS_RE
+from app.tools.http_client import get_http_client, limit_concurrency
+from app.tools.search_cache import cached_search
 
 
 class WikiSearchError(RuntimeError):
@@ -14,6 +20,7 @@ class WikiSearchError(RuntimeError):
 
 
 HTML_TAG_RE = re.compile(r"<[^>]+>")
+_TIMEOUT = httpx.Timeout(12.0, connect=5.0)
 
 
 def _wiki_headers() -> dict[str, str]:
@@ -28,7 +35,8 @@ def _wiki_headers() -> dict[str, str]:
 
 
 def _clean_snippet(value: str) -> str:
-    return " ".join(HTML_TAG_RE.sub("", value).split())
+    # Search snippets wrap matches in <span> tags and escape quotes/ampersands.
+    return WS_RE.sub(" ", html.unescape(HTML_TAG_RE.sub("", value))).strip()
 
 
 async def _search_mediawiki(query: str, max_results: int, client: httpx.AsyncClient) -> list[SourceFinding]:
@@ -43,9 +51,10 @@ async def _search_mediawiki(query: str, max_results: int, client: httpx.AsyncCli
         "https://en.wikipedia.org/w/api.php",
         params=params,
         headers=_wiki_headers(),
+        timeout=_TIMEOUT,
     )
     response.raise_for_status()
-    payload = response.json()
+    payload = orjson.loads(response.content)
 
     hits = payload.get("query", {}).get("search", [])
     findings: list[SourceFinding] = []
@@ -78,9 +87,10 @@ async def _search_opensearch(query: str, max_results: int, client: httpx.AsyncCl
         "https://en.wikipedia.org/w/api.php",
         params=params,
         headers=_wiki_headers(),
+        timeout=_TIMEOUT,
     )
     response.raise_for_status()
-    payload = response.json()
+    payload = orjson.loads(response.content)
     # opensearch schema: [query, titles[], descriptions[], urls[]]
     if not isinstance(payload, list) or len(payload) < 4:
         return []
@@ -106,22 +116,36 @@ async def _search_opensearch(query: str, max_results: int, client: httpx.AsyncCl
     return findings
 
 
+@cached_search
+@limit_concurrency
 async def wikipedia_search(query: str, max_results: int = 5) -> list[SourceFinding]:
-    timeout = httpx.Timeout(12.0, connect=5.0)
-    safe_query = " ".join(query.split()).strip()[:350]
+    safe_query = WS_RE.sub(" ", query).strip()[:350]
     errors: list[str] = []
+    client = get_http_client()
+    # Start the opensearch fallback alongside the primary search so an empty
+    # primary result does not cost a second round trip.
+    fallback = asyncio.create_task(_search_opensearch(safe_query, max_results, client))
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            # Primary mode: rich snippet search
+        # Primary mode: rich snippet search
+        try:
             findings = await _search_mediawiki(safe_query, max_results, client)
             if findings:
                 return findings
-            # Secondary mode: opensearch fallback (often more permissive)
-            findings = await _search_opensearch(safe_query, max_results, client)
+        except Exception as exc:
+            errors.append(str(exc))
+        # Secondary mode: opensearch fallback (often more permissive)
+        try:
+            findings = await fallback
             if findings:
                 return findings
             errors.append("empty_results")
-    except Exception as exc:
-        errors.append(str(exc))
+        except Exception as exc:
+            errors.append(str(exc))
+    finally:
+        if not fallback.done():
+            fallback.cancel()
+        elif not fallback.cancelled():
+            # Retrieve an unused fallback failure so asyncio doesn't log it on GC.
+            fallback.exception()
 
     raise WikiSearchError("Wikipedia search failed: " + " | ".join(errors))
@@ -0,0 +1,11 @@
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+
+from app.main import app
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client():
+    # One ASGI client per module; tests that use it run on the module event loop.
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
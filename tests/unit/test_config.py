@@ -11,3 +11,9 @@ def test_search_budget_positive():
 
 def test_min_unique_domains_nonzero():
     assert c.MIN_UNIQUE_DOMAINS_PER_SUBQUESTION >= 1
+
+
+def test_query_intent_counts_distinct_terms():
+    assert c.query_intent("History and cultural background of the community") == "historical"
+    assert c.query_intent("Market history: investment risk and inflation") == "business"
+    assert c.query_intent("supermarket origins") == "business"
@@ -0,0 +1,61 @@
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+from app.tools import http_client
+from app.tools.http_client import post_with_retries
+
+
+def _client(statuses):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        status = statuses[len(calls) - 1]
+        if status is None:
+            raise httpx.ConnectError("boom", request=request)
+        return httpx.Response(status, json={})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), calls
+
+
+@pytest.mark.asyncio
+async def test_post_with_retries_recovers_from_transient_failures():
+    client, calls = _client([503, None, 200])
+    with patch("app.tools.http_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        response = await post_with_retries(client, "https://example.com", json={})
+    assert response.status_code == 200
+    assert len(calls) == 3
+    assert mock_sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_post_with_retries_returns_client_errors_immediately():
+    client, calls = _client([400, 200])
+    with patch("app.tools.http_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        response = await post_with_retries(client, "https://example.com", json={})
+    assert response.status_code == 400
+    assert len(calls) == 1
+    mock_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_limit_concurrency_caps_in_flight_calls():
+    in_flight = 0
+    peak = 0
+
+    async def call(i):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return i
+
+    with patch.object(http_client, "PROVIDER_MAX_CONCURRENCY", 2):
+        bounded = http_client.limit_concurrency(call)
+    results = await asyncio.gather(*(bounded(i) for i in range(6)))
+
+    assert results == list(range(6))
+    assert peak == 2
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock, patch
-from app.agents.planner import run_planner
+from app.agents.planner import _summarize_history, run_planner
 from app.models import Plan, SubQuestion
 
 @pytest.mark.asyncio
@@ -80,3 +80,10 @@ async def test_run_planner_with_history():
         )
         
         assert "SKIP_WEB_RESEARCH" in result.assumptions
+
+
+def test_summarize_history_collapses_whitespace_before_truncating():
+    history = [{"role": "user", "content": "Intro:\n" + " " * 600 + "real text " + "x" * 400}]
+    summary = _summarize_history(history)
+    assert summary.startswith("- user: Intro: real text x")
+    assert len(summary) == len("- user: ") + 220
@@ -0,0 +1,64 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from app.agents.quality import (
+    HARD_FAIL_SCORE,
+    _deterministic_quality,
+    run_quality_check,
+)
+
+
+def _report(body: str) -> str:
+    return "\n".join(
+        [
+            "Context",
+            "-------",
+            body,
+            "Findings by Sub-Question",
+            "Contradictions and Gaps",
+            "Actionable Takeaways",
+            "Limitations and Assumptions",
+        ]
+    )
+
+
+def test_deterministic_quality_full_report_passes():
+    report = _report(("Key risk and opportunity trade-off for the market [S1] [S2] [S3]. " * 20))
+    score, issues = _deterministic_quality(
+        report=report,
+        executive_summary="a\nb\nc\nd\ne",
+        citations=[],
+    )
+    assert score == 100
+    assert issues == []
+
+
+def test_deterministic_quality_headers_are_case_sensitive():
+    report = "context\nfindings by sub-question\n" + ("Risk and opportunity. " * 60)
+    score, issues = _deterministic_quality(report=report, executive_summary="", citations=[])
+    assert any(issue.startswith("Missing required sections: Context") for issue in issues)
+    assert "Limitations/assumptions are not explicit." in issues
+    assert score < 72
+
+
+def test_deterministic_quality_limitations_header_counts_as_marker():
+    report = _report(("RISK and Opportunity. " * 60))
+    _, issues = _deterministic_quality(report=report, executive_summary="", citations=[])
+    assert "Limitations/assumptions are not explicit." not in issues
+    assert "Analysis appears one-sided; include balanced perspective." not in issues
+
+
+@pytest.mark.asyncio
+async def test_quality_check_hard_fail_skips_llm():
+    with patch("app.agents.quality.call_openai_typed", new_callable=AsyncMock) as mock_llm:
+        result = await run_quality_check(
+            query="Test query",
+            report="Too short",
+            executive_summary="",
+            citations=[],
+        )
+
+    mock_llm.assert_not_called()
+    assert result.passed is False
+    assert result.score < HARD_FAIL_SCORE
+    assert result.issues
+    assert result.refinement_queries == result.issues[:4]
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock, patch
-from app.agents.researcher import run_research_batch, _BudgetManager
+from app.agents.researcher import run_research_batch, research_sub_question, _BudgetManager, _RunControls
 from app.models import SubQuestion, ResearchNote, SourceFinding, Citation, ResearchSynthesis
 from app.tools.tavily_search import SearchToolError
 from pydantic import HttpUrl
@@ -16,8 +16,7 @@ def sample_subquestions():
         )
     ]
 
-@pytest.mark.asyncio
-async def test_budget_manager_deduping():
+def test_budget_manager_deduping():
     budget = _BudgetManager()
     finding = SourceFinding(
         title="Test Source",
@@ -27,13 +26,13 @@ async def test_budget_manager_deduping():
     )
     
     # First acceptance
-    accepted, reason = await budget.try_accept("sq1", finding)
+    accepted, reason = budget.try_accept("sq1", finding)
     assert accepted is True
     assert reason == "accepted"
     
     # Second acceptance of same URL (different case/slashes handled by router/normalize)
     # Researcher.py uses normalize_url
-    accepted2, reason2 = await budget.try_accept("sq1", finding)
+    accepted2, reason2 = budget.try_accept("sq1", finding)
     assert accepted2 is False
     assert reason2 == "deduped"
 
@@ -89,3 +88,88 @@ async def test_research_failure_handling(sample_subquestions):
         assert "sq1" in notes
         assert len(errors) > 0
         assert "Search Timeout" in errors[0]["detail"]
+
+
+@pytest.mark.asyncio
+async def test_research_accepts_lower_ranked_when_top_candidates_rejected(sample_subquestions):
+    # The best-scoring candidates were all accepted by an earlier sub-question, so every one of
+    # them is deduped; a weaker but still acceptable candidate must not be cut from the ranking.
+    top = [
+        SourceFinding(
+            title="What is the current inflation rate 2025",
+            url=HttpUrl(f"https://source{i}.com/inflation"),
+            snippet="What is the current inflation rate",
+            source_name=f"source{i}.com",
+        )
+        for i in range(10)
+    ]
+    weaker = SourceFinding(
+        title="Current inflation rate overview",
+        url=HttpUrl("https://fresh.com/overview"),
+        snippet="What analysts say.",
+        source_name="fresh.com",
+    )
+    seeded = ResearchNote(
+        sub_question_id="sq0",
+        evidence_bullets=[],
+        findings=top,
+        contradictions=[],
+        gaps=[],
+    )
+    budget = _BudgetManager({"sq0": seeded})
+
+    async def mock_emit(event, data):
+        pass
+
+    with patch("app.agents.researcher.search_web_parallel", new_callable=AsyncMock) as mock_search, \
+         patch("app.agents.researcher.call_openai_typed", new_callable=AsyncMock, side_effect=RuntimeError):
+        mock_search.return_value = [*top, weaker]
+        note, _, _ = await research_sub_question(
+            sample_subquestions[0],
+            mock_emit,
+            budget,
+            _RunControls(max_calls=10),
+            simulated_failures=frozenset(),
+            intent="general",
+        )
+
+    assert [str(f.url) for f in note.findings] == ["https://fresh.com/overview"]
+
+
+@pytest.mark.asyncio
+async def test_research_only_spends_calls_on_searches_it_uses(sample_subquestions):
+    calls = 0
+
+    async def fake_search(**kwargs):
+        nonlocal calls
+        calls += 1
+        return [
+            SourceFinding(
+                title="What is the current inflation rate 2025",
+                url=HttpUrl(f"https://site{calls}-{i}.com/inflation"),
+                snippet="Current inflation rate",
+                source_name=f"site{calls}-{i}.com",
+            )
+            for i in range(3)
+        ]
+
+    async def mock_emit(event, data):
+        pass
+
+    controls = _RunControls(max_calls=10)
+    with patch("app.agents.researcher.search_web_parallel", side_effect=fake_search), \
+         patch("app.agents.researcher.call_openai_typed", new_callable=AsyncMock, side_effect=RuntimeError):
+        note, _, _ = await research_sub_question(
+            sample_subquestions[0],
+            mock_emit,
+            _BudgetManager(),
+            controls,
+            simulated_failures=frozenset(),
+            intent="historical",
+        )
+
+    # Query 1's hint phase fills 3 slots, so its broad phase is skipped; query 2's hint phase
+    # fills the last slot and nothing else runs.
+    assert calls == 2
+    assert controls.calls_made == 2
+    assert len(note.findings) == 4
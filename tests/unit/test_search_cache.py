@@ -0,0 +1,35 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from app.models import SourceFinding
+from app.tools.search_cache import cached_search
+
+
+def _finding():
+    return SourceFinding(title="T", url="https://a.com/x", snippet="S", source_name="a.com")
+
+
+@pytest.mark.asyncio
+async def test_cached_search_reuses_results_for_equivalent_queries():
+    provider = AsyncMock(return_value=[_finding()])
+    search = cached_search(provider)
+
+    first = await search("market  entry\nrisks", max_results=3, include_domains=["b.com", "a.com"])
+    second = await search("market entry risks", max_results=3, include_domains=["a.com", "b.com"])
+    await search("market entry risks", max_results=5)
+
+    assert first == second
+    assert provider.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_search_does_not_cache_failures_or_expired_entries():
+    provider = AsyncMock(side_effect=[RuntimeError("down"), [_finding()], [_finding()]])
+    search = cached_search(provider)
+
+    with pytest.raises(RuntimeError):
+        await search("q")
+    await search("q")
+    with patch("app.tools.search_cache.SEARCH_CACHE_TTL_SECONDS", 0):
+        await search("q")
+
+    assert provider.await_count == 3
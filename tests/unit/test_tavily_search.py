@@ -0,0 +1,26 @@
+from app.tools.tavily_search import _attempt_payloads, extract_source_name, normalize_url
+
+
+def test_normalize_url_fast_path():
+    assert normalize_url(" HTTP://WWW.Reuters.com/Markets/asia/?utm=1#top ") == "https://reuters.com/Markets/asia"
+    assert normalize_url("https://imf.org") == "https://imf.org"
+
+
+def test_normalize_url_falls_back_for_unusual_urls():
+    assert normalize_url("https://example.com/a;params?q=1") == "https://example.com/a"
+    assert normalize_url("https://[::1]:8080/x/") == "https://[::1]:8080/x"
+
+
+def test_extract_source_name():
+    assert extract_source_name("https://www.FT.com/content/abc") == "ft.com"
+    assert extract_source_name("not a url") == "unknown"
+
+
+def test_attempt_payloads_ladder():
+    base = {"query": "q", "search_depth": "advanced", "api_key": "k", "include_domains": ["imf.org"]}
+    attempts = list(_attempt_payloads(base))
+    assert attempts[0] is base
+    assert [a["search_depth"] for a in attempts] == ["advanced", "advanced", "basic"]
+    assert ["include_domains" in a for a in attempts] == [True, False, False]
+    assert all(a["api_key"] == "k" for a in attempts)
+    assert len(list(_attempt_payloads({"query": "q", "search_depth": "advanced"}))) == 2
@@ -0,0 +1,8 @@
+from app.text import collapsed_prefix
+
+
+def test_collapsed_prefix_matches_split_join():
+    samples = ["", "   ", "a  b\n\tc", "Intro:\n" + " " * 600 + "real text", "word " * 100]
+    for text in samples:
+        for limit in (0, 1, 7, 220):
+            assert collapsed_prefix(text, limit) == " ".join(text.split())[:limit]
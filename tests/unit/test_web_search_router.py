@@ -0,0 +1,65 @@
+import asyncio
+import pytest
+from unittest.mock import patch
+from app.models import SourceFinding
+from app.tools.web_search_router import search_web_parallel
+
+
+def _findings(prefix, count):
+    return [
+        SourceFinding(
+            title=f"{prefix} {idx}",
+            url=f"https://{prefix}{idx}.com/page",
+            snippet="S",
+            source_name=f"{prefix}{idx}.com",
+        )
+        for idx in range(count)
+    ]
+
+
+@pytest.fixture
+def providers_enabled(monkeypatch):
+    monkeypatch.setenv("EXA_API_KEY", "x")
+    monkeypatch.setenv("FIRECRAWL_API_KEY", "x")
+    monkeypatch.setenv("USE_EXA_PRIMARY", "true")
+    monkeypatch.setenv("USE_FIRECRAWL_PRIMARY", "true")
+
+
+@pytest.mark.asyncio
+async def test_search_cancels_slow_provider_when_first_has_enough(providers_enabled):
+    slow_cancelled = asyncio.Event()
+
+    async def fast(**kwargs):
+        return _findings("exa", 6)
+
+    async def slow(**kwargs):
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            slow_cancelled.set()
+            raise
+        return []
+
+    with patch("app.tools.web_search_router.exa_search", side_effect=fast), \
+         patch("app.tools.web_search_router.firecrawl_search", side_effect=slow):
+        results = await asyncio.wait_for(search_web_parallel(query="q", max_results=3), timeout=2)
+        await asyncio.sleep(0)
+
+    assert len(results) == 6
+    assert slow_cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_search_waits_grace_period_for_second_provider(providers_enabled):
+    async def fast(**kwargs):
+        return _findings("exa", 1)
+
+    async def slower(**kwargs):
+        await asyncio.sleep(0.05)
+        return _findings("fc", 1)
+
+    with patch("app.tools.web_search_router.exa_search", side_effect=fast), \
+         patch("app.tools.web_search_router.firecrawl_search", side_effect=slower):
+        results = await search_web_parallel(query="q", max_results=3)
+
+    assert [finding.title for finding in results] == ["exa 0", "fc 0"]
@@ -0,0 +1,73 @@
+import asyncio
+import gc
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.models import SourceFinding
+from app.tools import wiki_search
+
+
+def _finding(title: str) -> SourceFinding:
+    return SourceFinding(
+        title=title,
+        url=f"https://en.wikipedia.org/wiki/{title}",
+        snippet="snippet",
+        source_name="wikipedia.org",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    wiki_search.wikipedia_search.cache_clear()
+    yield
+    wiki_search.wikipedia_search.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_wikipedia_search_prefers_mediawiki_results():
+    with patch.object(wiki_search, "_search_mediawiki", AsyncMock(return_value=[_finding("Primary")])), patch.object(
+        wiki_search, "_search_opensearch", AsyncMock(return_value=[_finding("Fallback")])
+    ):
+        findings = await wiki_search.wikipedia_search("inflation", 3)
+    assert [f.title for f in findings] == ["Primary"]
+
+
+@pytest.mark.asyncio
+async def test_wikipedia_search_falls_back_to_opensearch():
+    with patch.object(wiki_search, "_search_mediawiki", AsyncMock(side_effect=RuntimeError("boom"))), patch.object(
+        wiki_search, "_search_opensearch", AsyncMock(return_value=[_finding("Fallback")])
+    ):
+        findings = await wiki_search.wikipedia_search("inflation", 3)
+    assert [f.title for f in findings] == ["Fallback"]
+
+
+@pytest.mark.asyncio
+async def test_wikipedia_search_raises_when_both_empty():
+    with patch.object(wiki_search, "_search_mediawiki", AsyncMock(return_value=[])), patch.object(
+        wiki_search, "_search_opensearch", AsyncMock(return_value=[])
+    ):
+        with pytest.raises(wiki_search.WikiSearchError, match="empty_results"):
+            await wiki_search.wikipedia_search("inflation", 3)
+
+
+@pytest.mark.asyncio
+async def test_wikipedia_search_retrieves_unused_fallback_error():
+    async def slow_primary(*args):
+        await asyncio.sleep(0.01)
+        return [_finding("Primary")]
+
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+    try:
+        with patch.object(wiki_search, "_search_mediawiki", slow_primary), patch.object(
+            wiki_search, "_search_opensearch", AsyncMock(side_effect=RuntimeError("boom"))
+        ):
+            findings = await wiki_search.wikipedia_search("inflation", 3)
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert [f.title for f in findings] == ["Primary"]
+    assert unhandled == []
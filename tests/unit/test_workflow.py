@@ -0,0 +1,28 @@
+from app.graph.workflow import _dump_notes
+from app.models import ResearchNote
+
+
+def _note(sub_question_id: str, bullet: str) -> ResearchNote:
+    return ResearchNote(
+        sub_question_id=sub_question_id,
+        evidence_bullets=[bullet],
+        findings=[],
+        contradictions=[],
+        gaps=[],
+    )
+
+
+def test_dump_notes_reuses_dumps_within_a_run_only():
+    sq1, sq2 = _note("sq1", "a"), _note("sq2", "b")
+    state = {"metadata": {}}
+    first = _dump_notes(state, {"sq1": sq1, "sq2": sq2})
+
+    # A rewrite pass where refinement replaced sq2's note.
+    replaced = _note("sq2", "c")
+    second = _dump_notes(state, {"sq1": sq1, "sq2": replaced})
+    assert second["sq1"] is first["sq1"]
+    assert second["sq2"]["evidence_bullets"] == ["c"]
+
+    other_run = _dump_notes({"metadata": {}}, {"sq1": sq1})
+    assert other_run["sq1"] is not first["sq1"]
+    assert other_run["sq1"] == first["sq1"]
@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock, patch
-from app.agents.writer import stream_report_chunks
+from app.agents.writer import _compress_history, stream_report_chunks
 from app.models import Citation, FinalReport
 from pydantic import HttpUrl
 
@@ -67,3 +67,102 @@ async def test_writer_fallback():
         # Should use _fallback_report
         assert "fallback" in result.executive_summary.lower()
         assert "SQ1" in result.report
+
+@pytest.mark.asyncio
+async def test_writer_coalesces_stream_tokens():
+    emitted = []
+
+    async def mock_emit(event, data):
+        if event == "message":
+            emitted.append(data["chunk"])
+
+    tokens = ["Context", "\n", "-------", "\n"] + ["word "] * 100
+
+    with patch("app.agents.writer.stream_openai_text") as mock_stream, \
+         patch("app.agents.writer.call_openai_typed", side_effect=Exception("API Down")):
+
+        async def mock_tokens():
+            for token in tokens:
+                yield token
+        mock_stream.return_value = mock_tokens()
+
+        await stream_report_chunks(
+            query="Test query",
+            research_notes={},
+            citations=[],
+            history=[],
+            shared_memory={},
+            quality_score=None,
+            quality_feedback=[],
+            rewrite_iteration=0,
+            emit_event=mock_emit
+        )
+
+    assert "".join(emitted) == "".join(tokens)
+    assert len(emitted) < len(tokens) // 10
+
+
+@pytest.mark.asyncio
+async def test_writer_skips_summary_call_for_well_formed_report():
+    async def mock_emit(event, data):
+        pass
+
+    report = "\n".join(
+        [
+            "Context",
+            "-------",
+            "Demand is rising in the region.",
+            "Findings by Sub-Question",
+            "------------------------",
+            "SQ1",
+            "- Growth averaged 4% [S1]",
+            "- Regulation is tightening [S2]",
+            "- Competitors are consolidating [S3]",
+            "- Logistics costs are falling [S1]",
+            "Contradictions and Gaps",
+            "-----------------------",
+            "- Sources disagree on 2025 growth.",
+            "Actionable Takeaways",
+            "--------------------",
+            "- Enter via a local partner.",
+            "- Price for the mid-market.",
+            "- Track regulatory changes.",
+            "- Invest in logistics.",
+            "Limitations and Assumptions",
+            "---------------------------",
+            "- Data beyond 2024 is sparse.",
+        ]
+    )
+
+    with patch("app.agents.writer.stream_openai_text") as mock_stream, \
+         patch("app.agents.writer.call_openai_typed", new_callable=AsyncMock) as mock_llm:
+
+        async def mock_tokens():
+            yield report
+        mock_stream.return_value = mock_tokens()
+
+        result = await stream_report_chunks(
+            query="Test query",
+            research_notes={},
+            citations=[],
+            history=[],
+            shared_memory={},
+            quality_score=None,
+            quality_feedback=[],
+            rewrite_iteration=0,
+            emit_event=mock_emit
+        )
+
+    mock_llm.assert_not_called()
+    assert result.report == report
+    assert result.executive_summary.splitlines()[0] == "Demand is rising in the region."
+    assert len(result.executive_summary.splitlines()) == 5
+    assert result.key_takeaways[0] == "Enter via a local partner."
+    assert result.limitations == "Data beyond 2024 is sparse."
+
+
+def test_compress_history_collapses_whitespace_before_truncating():
+    history = [{"role": "assistant", "content": "\n" * 700 + "Prior   answer\t" + "y" * 400}]
+    [item] = _compress_history(history)
+    assert item["content"].startswith("Prior answer y")
+    assert len(item["content"]) == 280